@@ -6,14 +6,110 @@ import json
 import os
 import subprocess
 import sys
+import tempfile
 import time
 
-from asc_auth import generate_token
-from asc_api import list_apps, list_builds, get_app
+# Optional: faster JSON encoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# asc_auth (cryptography) and asc_api (requests) are imported inside
+# main() so --help and argument errors don't pay for loading them
+
+
+def print_json(data):
+    """Print a result as JSON on stdout."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data) + b'\n')
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(data))
+
+
+def format_utc(ts):
+    """
+    Format a Unix timestamp as an ISO 8601 UTC string (YYYY-MM-DDTHH:MM:SSZ).
+    
+    Uses integer civil-date arithmetic instead of time.gmtime() + strftime.
+    """
+    days, secs = divmod(int(ts), 86400)
+    hour, secs = divmod(secs, 3600)
+    minute, second = divmod(secs, 60)
+    
+    # Days since 1970-01-01 -> proleptic Gregorian date (400-year eras from 0000-03-01)
+    era, doe = divmod(days + 719468, 146097)
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 if mp < 10 else mp - 9
+    year = yoe + era * 400 + (month <= 2)
+    return f'{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}Z'
+
+
+LICENSE_FILE = os.path.expanduser('~/.axctl/license.json')
+LICENSE_CACHE_FILE = os.path.expanduser('~/.axctl_license_cache')
+LICENSE_CACHE_TTL = 86400  # Re-run the Node checker at least once a day
+
+
+def _license_mtime():
+    """Return the license file's mtime, or None if it doesn't exist."""
+    try:
+        return os.stat(LICENSE_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _license_cached() -> bool:
+    """Return True if a previous license check passed recently for the current license file."""
+    try:
+        with open(LICENSE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return False
+    
+    if not isinstance(cache, dict):
+        return False
+    mtime = _license_mtime()
+    return (
+        mtime is not None
+        and cache.get('license_mtime') == mtime
+        and cache.get('expires_at', 0) > time.time()
+    )
+
+
+def _cache_license_result() -> None:
+    """Remember a successful license check for LICENSE_CACHE_TTL seconds."""
+    cache = {'expires_at': time.time() + LICENSE_CACHE_TTL, 'license_mtime': _license_mtime()}
+    
+    # Same atomic, owner-only write as asc_auth._write_cache (not imported:
+    # asc_auth loads cryptography, which check_license runs before)
+    cache_dir = os.path.dirname(LICENSE_CACHE_FILE) or '.'
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.axctl_license_')
+    except OSError:
+        return
+    try:
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, LICENSE_CACHE_FILE)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 
 def check_license():
     """Check for valid Pro license."""
+    # Skip spawning Node if the license already checked out recently
+    if _license_cached():
+        return
+    
     script_dir = os.path.dirname(os.path.abspath(__file__))
     check_script = os.path.join(script_dir, '..', '..', 'bin', 'check-license.js')
     
@@ -25,14 +121,122 @@ def check_license():
         result = subprocess.run(['node', check_script], capture_output=True)
         if result.returncode != 0:
             sys.exit(1)
+        _cache_license_result()
     else:
         print('❌ License checker not found. Please reinstall AXCTL.', file=sys.stderr)
         sys.exit(1)
 
 
-def main():
-    # Check for valid Pro license
-    check_license()
+def call_with_reauth(args, token, fn, *fn_args, **fn_kwargs):
+    """Call an API function, retrying once with a fresh token on auth failure."""
+    from asc_auth import get_valid_token, invalidate_cached_token
+    
+    result = fn(token, *fn_args, **fn_kwargs)
+    if 'Authentication failed' in result.get('error', ''):
+        # The cached token may have been revoked - drop it and re-sign
+        invalidate_cached_token(args.key_id, args.issuer_id, args.key_file)
+        token = get_valid_token(args.key_id, args.issuer_id, args.key_file,
+                                use_cache=False, signer=args.signer)
+        result = fn(token, *fn_args, **fn_kwargs)
+    return result
+
+
+# Fast-path argument spec: flag -> (dest, type); a None type is a store_true flag
+_GLOBAL_FLAGS = {
+    '--key-id': ('key_id', str),
+    '--issuer-id': ('issuer_id', str),
+    '--key-file': ('key_file', str),
+    '--no-cache': ('no_cache', None),
+    '--max-age': ('max_age', float),
+}
+_COMMAND_FLAGS = {
+    'auth-test': {},
+    'list-apps': {},
+    'list-builds': {'--app-id': ('app_id', str), '--limit': ('limit', int)},
+    'get-app': {'--app-id': ('app_id', str)},
+    'get-apps-bulk': {'--app-ids': ('app_ids', str)},
+}
+_REQUIRED = {
+    'auth-test': (),
+    'list-apps': (),
+    'list-builds': ('app_id',),
+    'get-app': ('app_id',),
+    'get-apps-bulk': ('app_ids',),
+}
+
+
+def fast_parse_args(argv):
+    """
+    Parse well-formed command lines without constructing argparse.
+    
+    Accepts the same shape argparse does (global flags, command, command
+    flags). Returns None for anything else - help, unknown flags, bad
+    values - so build_parser() can handle it and report errors.
+    """
+    values = {'no_cache': False, 'max_age': 0.0}
+    command = None
+    flags = _GLOBAL_FLAGS
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if not arg.startswith('--'):
+            if command is not None or arg not in _COMMAND_FLAGS:
+                return None
+            command = arg
+            flags = _COMMAND_FLAGS[command]
+            i += 1
+            continue
+        
+        name, has_inline, inline = arg.partition('=')
+        if name not in flags:
+            return None
+        dest, conv = flags[name]
+        if conv is None:
+            if has_inline:
+                return None
+            values[dest] = True
+            i += 1
+            continue
+        
+        if has_inline:
+            raw = inline
+            i += 1
+        elif i + 1 < len(argv) and not argv[i + 1].startswith('-'):
+            raw = argv[i + 1]
+            i += 2
+        else:
+            return None
+        try:
+            values[dest] = conv(raw)
+        except ValueError:
+            return None
+    
+    if command is None:
+        return None
+    if command == 'list-builds':
+        values.setdefault('limit', 10)
+    for dest in ('key_id', 'issuer_id', 'key_file') + _REQUIRED[command]:
+        if dest not in values:
+            return None
+    return argparse.Namespace(command=command, **values)
+
+
+def _split_app_ids(value):
+    """Parse a comma-separated --app-ids value."""
+    return [app_id.strip() for app_id in value.split(',') if app_id.strip()]
+
+
+# API command -> (asc_api function, positional args after the token, supports the response cache)
+_DISPATCH = {
+    'list-apps': ('list_apps', lambda args: (), True),
+    'list-builds': ('list_builds', lambda args: (args.app_id, args.limit), False),
+    'get-app': ('get_app', lambda args: (args.app_id,), True),
+    'get-apps-bulk': ('get_apps_bulk', lambda args: (_split_app_ids(args.app_ids),), True),
+}
+
+
+def build_parser():
+    """Build the full argparse parser (used for --help and unusual command lines)."""
     parser = argparse.ArgumentParser(
         description='App Store Connect API Helper'
     )
@@ -41,6 +245,9 @@ def main():
     parser.add_argument('--key-id', required=True, help='App Store Connect Key ID')
     parser.add_argument('--issuer-id', required=True, help='App Store Connect Issuer ID')
     parser.add_argument('--key-file', required=True, help='Path to .p8 private key file')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk response cache')
+    parser.add_argument('--max-age', type=float, default=0,
+                        help='Reuse cached responses younger than this many seconds without revalidating')
     
     subparsers = parser.add_subparsers(dest='command', required=True)
     
@@ -59,16 +266,32 @@ def main():
     get_app_parser = subparsers.add_parser('get-app', help='Get detailed app info')
     get_app_parser.add_argument('--app-id', required=True, help='App ID')
     
-    args = parser.parse_args()
+    # get-apps-bulk command
+    get_apps_bulk_parser = subparsers.add_parser('get-apps-bulk', help='Get detailed info for several apps')
+    get_apps_bulk_parser.add_argument('--app-ids', required=True, help='Comma-separated app IDs')
+    
+    return parser
+
+
+def main():
+    # Check for valid Pro license
+    check_license()
+    args = fast_parse_args(sys.argv[1:]) or build_parser().parse_args()
+    
+    from asc_auth import get_valid_token, prepare_signer, token_expiry
+    
+    # One signer per run: the .p8 is parsed at most once, and only if a
+    # token actually has to be signed (not on a token cache hit)
+    args.signer = prepare_signer(args.key_file)
     
     # Generate token
     try:
-        token = generate_token(args.key_id, args.issuer_id, args.key_file)
+        token = get_valid_token(args.key_id, args.issuer_id, args.key_file, signer=args.signer)
     except FileNotFoundError:
-        print(json.dumps({'error': f'Key file not found: {args.key_file}'}))
+        print_json({'error': f'Key file not found: {args.key_file}'})
         sys.exit(1)
     except Exception as e:
-        print(json.dumps({'error': f'Failed to generate token: {e}'}))
+        print_json({'error': f'Failed to generate token: {e}'})
         sys.exit(1)
     
     # Execute command
@@ -77,44 +300,23 @@ def main():
             'success': True,
             'issuer_id': args.issuer_id,
             'key_id': args.key_id,
-            'token_expires': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(time.time() + 1200))
+            # A reused token expires before now + 20 minutes - report its real exp
+            'token_expires': format_utc(token_expiry(token) or time.time() + 1200)
         }
-        print(json.dumps(result))
+        print_json(result)
         sys.exit(0)
     
-    elif args.command == 'list-apps':
-        result = list_apps(token)
-        if 'error' in result:
-            # Check if it's an auth error
-            if 'Authentication failed' in result.get('error', ''):
-                print(json.dumps(result))
-                sys.exit(2)
-            print(json.dumps(result))
-            sys.exit(1)
-        print(json.dumps(result))
-        sys.exit(0)
-    
-    elif args.command == 'list-builds':
-        result = list_builds(token, args.app_id, args.limit)
-        if 'error' in result:
-            if 'Authentication failed' in result.get('error', ''):
-                print(json.dumps(result))
-                sys.exit(2)
-            print(json.dumps(result))
-            sys.exit(1)
-        print(json.dumps(result))
-        sys.exit(0)
+    # API commands: one table-driven call/report path
+    import asc_api
+    fn_name, fn_args, cached = _DISPATCH[args.command]
+    fn_kwargs = {'use_cache': not args.no_cache, 'max_age': args.max_age} if cached else {}
+    result = call_with_reauth(args, token, getattr(asc_api, fn_name), *fn_args(args), **fn_kwargs)
     
-    elif args.command == 'get-app':
-        result = get_app(token, args.app_id)
-        if 'error' in result:
-            if 'Authentication failed' in result.get('error', ''):
-                print(json.dumps(result))
-                sys.exit(2)
-            print(json.dumps(result))
-            sys.exit(1)
-        print(json.dumps(result))
-        sys.exit(0)
+    print_json(result)
+    if 'error' in result:
+        # Exit 2 for auth errors, 1 for anything else
+        sys.exit(2 if 'Authentication failed' in result['error'] else 1)
+    sys.exit(0)
 
 
 if __name__ == '__main__':
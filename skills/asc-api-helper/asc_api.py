@@ -1,50 +1,172 @@
 """API client functions for App Store Connect."""
 
+import base64
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as _Urllib3HTTPError
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+import asc_cache
+
+# Optional: stream-decode large list responses instead of buffering them
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors raised while reading or decoding a response body: dropped/timed-out
+# connections (requests wraps some, urllib3 raises others mid-stream) and bad JSON
+_BODY_ERRORS = (requests.exceptions.RequestException, _Urllib3HTTPError, ValueError)
+if ijson is not None:
+    _BODY_ERRORS += (ijson.JSONError,)
+
+# Optional: faster JSON decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 BASE_URL = 'https://api.appstoreconnect.apple.com/v1'
 
+# Shared keep-alive session so repeated calls reuse the TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=25,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,  # Surface the final response to raise_for_status()
+    ),
+))
+# Ask for compressed JSON; ACCEPT_ENCODING lists only the codings urllib3 can
+# decode here (gzip/deflate, plus br/zstd when those packages are installed)
+_SESSION.headers.update({
+    'Content-Type': 'application/json',
+    'Accept': 'application/json',
+    'Accept-Encoding': ACCEPT_ENCODING,
+})
+
+# (output key, API attribute, default) for each record type
+_APP_FIELDS = (
+    ('bundle_id', 'bundleId', ''),
+    ('name', 'name', ''),
+    ('sku', 'sku', ''),
+    ('platform', 'platform', ''),
+)
+_BUILD_FIELDS = (
+    ('version', 'version', ''),
+    ('build_number', 'buildNumber', ''),
+    ('upload_date', 'uploadDate', ''),
+    ('processing_state', 'processingState', ''),
+    ('expired', 'expired', False),
+    ('testflight_enabled', 'testflightEnabled', True),
+)
+
+
+def _auth_headers(token: str) -> dict:
+    """Per-request headers (session defaults cover the rest)."""
+    return {'Authorization': f'Bearer {token}'}
 
-def list_apps(token: str) -> dict:
+
+def _decode_json(response) -> dict:
+    """Decode a response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _token_issuer(token: str) -> str:
+    """Read the (unverified) issuer claim from a JWT, used to scope the response cache."""
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return str(claims.get('iss', ''))
+    except (IndexError, ValueError, AttributeError):
+        return ''
+
+
+def _cached_get(token: str, url: str, params: dict = None, use_cache: bool = True,
+                max_age: float = 0) -> dict:
+    """
+    GET a JSON resource, revalidating a cached copy with If-None-Match/If-Modified-Since.
+    
+    Args:
+        token: JWT token for authentication
+        url: Resource URL
+        params: Query parameters
+        use_cache: Read and update the on-disk response cache
+        max_age: Serve a cached body younger than this many seconds without any request
+        
+    Returns:
+        Decoded JSON body
+        
+    Raises:
+        requests.exceptions.RequestException: On network or HTTP errors
+    """
+    entry = None
+    if use_cache:
+        key = asc_cache.cache_key(url, params, _token_issuer(token))
+        entry = asc_cache.load(key)
+        if entry and max_age and time.time() - entry.get('fetched_at', 0) < max_age:
+            return entry['body']
+    
+    headers = _auth_headers(token)
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    
+    response = _SESSION.get(url, headers=headers, params=params)
+    if entry and response.status_code == 304:
+        asc_cache.touch(key, entry)
+        return entry['body']
+    response.raise_for_status()
+    
+    data = _decode_json(response)
+    if use_cache:
+        asc_cache.save(key, response.headers.get('ETag'), response.headers.get('Last-Modified'), data)
+    return data
+
+
+def list_apps(token: str, use_cache: bool = True, max_age: float = 0) -> dict:
     """
     List all apps in the account.
     
     Args:
         token: JWT token for authentication
+        use_cache: Revalidate a cached response instead of re-downloading it
+        max_age: Serve a cached response younger than this many seconds as-is
         
     Returns:
         Dict containing apps list and count
     """
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Content-Type': 'application/json',
-    }
-    
     try:
-        response = requests.get(
+        data = _cached_get(
+            token,
             f'{BASE_URL}/apps',
-            headers=headers,
-            params={'limit': 200}
+            params={'limit': 200},
+            use_cache=use_cache,
+            max_age=max_age,
         )
-        response.raise_for_status()
     except requests.exceptions.HTTPError as e:
-        if response.status_code == 401:
+        if e.response.status_code == 401:
             return {'error': 'Authentication failed. Check your credentials.'}
         return {'error': f'HTTP error: {e}'}
     except requests.exceptions.RequestException as e:
         return {'error': f'Request failed: {e}'}
     
-    data = response.json()
-    
-    apps = []
-    for app in data.get('data', []):
-        apps.append({
-            'id': app['id'],
-            'bundle_id': app['attributes'].get('bundleId', ''),
-            'name': app['attributes'].get('name', ''),
-            'sku': app['attributes'].get('sku', ''),
-            'platform': app['attributes'].get('platform', '')
-        })
+    apps = [
+        {'id': app['id'], **{out: app['attributes'].get(attr, default) for out, attr, default in _APP_FIELDS}}
+        for app in data.get('data', ())
+    ]
     
     return {
         'apps': apps,
@@ -64,19 +186,15 @@ def list_builds(token: str, app_id: str, limit: int = 10) -> dict:
     Returns:
         Dict containing builds list and count
     """
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Content-Type': 'application/json',
-    }
-    
     try:
-        response = requests.get(
+        response = _SESSION.get(
             f'{BASE_URL}/builds',
-            headers=headers,
+            headers=_auth_headers(token),
             params={
                 'filter[app]': app_id,
                 'limit': limit
-            }
+            },
+            stream=ijson is not None
         )
         response.raise_for_status()
     except requests.exceptions.HTTPError as e:
@@ -86,19 +204,21 @@ def list_builds(token: str, app_id: str, limit: int = 10) -> dict:
     except requests.exceptions.RequestException as e:
         return {'error': f'Request failed: {e}'}
     
-    data = response.json()
-    
-    builds = []
-    for build in data.get('data', []):
-        builds.append({
-            'id': build['id'],
-            'version': build['attributes'].get('version', ''),
-            'build_number': build['attributes'].get('buildNumber', ''),
-            'upload_date': build['attributes'].get('uploadDate', ''),
-            'processing_state': build['attributes'].get('processingState', ''),
-            'expired': build['attributes'].get('expired', False),
-            'testflight_enabled': build['attributes'].get('testflightEnabled', True)
-        })
+    try:
+        with response:
+            if ijson is not None:
+                # Decode builds one at a time straight off the socket
+                response.raw.decode_content = True
+                items = ijson.items(response.raw, 'data.item')
+            else:
+                items = _decode_json(response).get('data', [])
+            
+            builds = [
+                {'id': build['id'], **{out: build['attributes'].get(attr, default) for out, attr, default in _BUILD_FIELDS}}
+                for build in items
+            ]
+    except _BODY_ERRORS as e:
+        return {'error': f'Request failed: {e}'}
     
     return {
         'builds': builds,
@@ -106,36 +226,32 @@ def list_builds(token: str, app_id: str, limit: int = 10) -> dict:
     }
 
 
-def get_app(token: str, app_id: str) -> dict:
+def get_app(token: str, app_id: str, use_cache: bool = True, max_age: float = 0) -> dict:
     """
     Get detailed app info.
     
     Args:
         token: JWT token for authentication
         app_id: The app ID to get details for
+        use_cache: Revalidate a cached response instead of re-downloading it
+        max_age: Serve a cached response younger than this many seconds as-is
         
     Returns:
         Dict containing app details
     """
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Content-Type': 'application/json',
-    }
-    
     try:
-        response = requests.get(
+        data = _cached_get(
+            token,
             f'{BASE_URL}/apps/{app_id}',
-            headers=headers
+            use_cache=use_cache,
+            max_age=max_age,
         )
-        response.raise_for_status()
     except requests.exceptions.HTTPError as e:
-        if response.status_code == 401:
+        if e.response.status_code == 401:
             return {'error': 'Authentication failed. Check your credentials.'}
         return {'error': f'HTTP error: {e}'}
     except requests.exceptions.RequestException as e:
         return {'error': f'Request failed: {e}'}
-    
-    data = response.json()
     app = data.get('data', {})
     attrs = app.get('attributes', {})
     
@@ -148,3 +264,46 @@ def get_app(token: str, app_id: str) -> dict:
         'available_in_new_territories': attrs.get('availableInNewTerritories', True),
         'content_rights_declaration': attrs.get('contentRightsDeclaration', '')
     }
+
+
+def get_apps_bulk(token: str, app_ids: list, max_workers: int = 25, use_cache: bool = True,
+                  max_age: float = 0) -> dict:
+    """
+    Get detailed app info for several apps concurrently.
+    
+    Requests are fanned out over a thread pool sharing the pooled session,
+    so N apps cost roughly one round-trip instead of N.
+    
+    Args:
+        token: JWT token for authentication
+        app_ids: The app IDs to get details for
+        max_workers: Maximum concurrent requests
+        use_cache: Revalidate cached responses instead of re-downloading them
+        max_age: Serve cached responses younger than this many seconds as-is
+        
+    Returns:
+        Dict containing apps list (same shape as get_app) and count.
+        Apps that could not be fetched carry an 'error' key.
+    """
+    if not app_ids:
+        return {'apps': [], 'count': 0}
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(app_ids))) as executor:
+        results = list(executor.map(
+            lambda app_id: get_app(token, app_id, use_cache=use_cache, max_age=max_age),
+            app_ids,
+        ))
+    
+    apps = []
+    for app_id, result in zip(app_ids, results):
+        if 'error' in result:
+            # A rejected token fails every request - report it once
+            if 'Authentication failed' in result['error']:
+                return result
+            result = {'id': app_id, 'error': result['error']}
+        apps.append(result)
+    
+    return {
+        'apps': apps,
+        'count': len(apps)
+    }
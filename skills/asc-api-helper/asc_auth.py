@@ -1,18 +1,217 @@
 """JWT token generation for App Store Connect API."""
 
-import jwt
+import base64
+import functools
+import hashlib
+import json
+import os
+import tempfile
 import time
-from cryptography.hazmat.primitives import serialization
+from typing import Callable, Optional, Tuple
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
 
+# Signed tokens are cached on disk so back-to-back CLI calls reuse one JWT
+TOKEN_CACHE_FILE = os.path.expanduser('~/.axctl_asc_jwt_cache.json')
+TOKEN_LIFETIME = 1200  # 20 minutes
+TOKEN_REFRESH_MARGIN = 120  # Re-sign once less than 2 minutes remain
 
-def generate_token(key_id: str, issuer_id: str, key_file: str) -> str:
+# Parsed private keys, keyed by (path, mtime_ns, size) of the .p8 file
+_KEY_CACHE = {}
+
+# In-process (token, exp) pairs, keyed by (key_id, issuer_id, key_file, mtime_ns)
+_TOKEN_MEMO = {}
+
+
+def _cache_key(key_id: str, issuer_id: str, key_file: str) -> str:
+    """Build the cache key for a credential set (changes if the .p8 is replaced)."""
+    key_file_mtime = os.stat(key_file).st_mtime_ns
+    return hashlib.sha256(f'{key_id}\0{issuer_id}\0{key_file_mtime}'.encode()).hexdigest()
+
+
+def _read_cache(cache_path: str) -> dict:
+    """Read the token cache file, returning an empty dict if missing or corrupt."""
+    try:
+        with open(cache_path, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache(cache_path: str, data: dict) -> None:
+    """Atomically write the token cache file with owner-only permissions."""
+    cache_dir = os.path.dirname(cache_path) or '.'
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.axctl_asc_jwt_')
+    except OSError:
+        return
+    try:
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_cached_token(cache_path: str, cache_key: str) -> Optional[Tuple[str, int]]:
+    """
+    Return a cached token if it has more than TOKEN_REFRESH_MARGIN seconds left.
+    
+    Args:
+        cache_path: Path to the token cache file
+        cache_key: Key identifying the credential set
+        
+    Returns:
+        (token, exp) tuple, or None if no usable token is cached
+    """
+    entry = _read_cache(cache_path).get(cache_key)
+    if not isinstance(entry, dict):
+        return None
+    
+    token = entry.get('token')
+    exp = entry.get('exp', 0)
+    if not token or exp - time.time() <= TOKEN_REFRESH_MARGIN:
+        return None
+    return token, exp
+
+
+def _store_cached_token(cache_path: str, cache_key: str, token: str, exp: int) -> None:
+    """Persist a freshly signed token, dropping any expired entries."""
+    now = time.time()
+    data = {
+        k: v for k, v in _read_cache(cache_path).items()
+        if isinstance(v, dict) and v.get('exp', 0) > now
+    }
+    data[cache_key] = {'token': token, 'exp': exp}
+    _write_cache(cache_path, data)
+
+
+def _load_private_key(key_file: str):
+    """Load and parse a .p8 private key, reusing the parsed key while the file is unchanged."""
+    st = os.stat(key_file)
+    cache_key = (key_file, st.st_mtime_ns, st.st_size)
+    private_key = _KEY_CACHE.get(cache_key)
+    if private_key is None:
+        with open(key_file, 'rb') as f:
+            private_key = serialization.load_pem_private_key(f.read(), password=None)
+        _KEY_CACHE[cache_key] = private_key
+    return private_key
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64URL-encode without padding, as JWT requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+@functools.lru_cache(maxsize=8)
+def _jwt_header_b64(key_id: str) -> bytes:
+    """Build the encoded (constant per key) JWT header segment."""
+    header = {
+        'alg': 'ES256',
+        'kid': key_id,
+        'typ': 'JWT',
+    }
+    return _b64url(json.dumps(header, separators=(',', ':')).encode())
+
+
+def invalidate_cached_token(key_id: str, issuer_id: str, key_file: str) -> None:
+    """
+    Remove the cached token for a credential set (e.g. after a 401 response).
+    
+    Args:
+        key_id: The Key ID from App Store Connect
+        issuer_id: The Issuer ID from App Store Connect
+        key_file: Path to the .p8 private key file
+    """
+    for memo_key in [k for k in _TOKEN_MEMO if k[:3] == (key_id, issuer_id, key_file)]:
+        del _TOKEN_MEMO[memo_key]
+    
+    try:
+        cache_key = _cache_key(key_id, issuer_id, key_file)
+    except OSError:
+        return
+    
+    data = _read_cache(TOKEN_CACHE_FILE)
+    if data.pop(cache_key, None) is not None:
+        _write_cache(TOKEN_CACHE_FILE, data)
+
+
+def prepare_signer(key_file: str) -> Callable[..., str]:
+    """
+    Build a JWT signing function bound to one .p8 private key.
+    
+    The key is read and parsed on the first signature only, so a process
+    that issues many tokens pays for the PEM load once.
+    
+    Args:
+        key_file: Path to the .p8 private key file
+        
+    Returns:
+        sign(key_id, issuer_id, exp=None) -> JWT token string
+    """
+    private_key = None
+    
+    def sign(key_id: str, issuer_id: str, exp: Optional[int] = None) -> str:
+        nonlocal private_key
+        if private_key is None:
+            private_key = _load_private_key(key_file)
+        
+        payload = {
+            'iss': issuer_id,
+            'exp': exp or int(time.time()) + TOKEN_LIFETIME,
+            'aud': 'appstoreconnect-v1',
+        }
+        signing_input = (
+            _jwt_header_b64(key_id) + b'.'
+            + _b64url(json.dumps(payload, separators=(',', ':')).encode())
+        )
+        
+        # ES256 signatures are raw r || s (32 bytes each), not DER
+        r, s = decode_dss_signature(private_key.sign(signing_input, ec.ECDSA(hashes.SHA256())))
+        signature = r.to_bytes(32, 'big') + s.to_bytes(32, 'big')
+        return (signing_input + b'.' + _b64url(signature)).decode()
+    
+    return sign
+
+
+def _sign_token(key_id: str, issuer_id: str, key_file: str, use_cache: bool,
+                signer: Optional[Callable[..., str]] = None) -> Tuple[str, int]:
+    """Return a (token, exp) pair, from the on-disk cache or freshly signed."""
+    cache_key = _cache_key(key_id, issuer_id, key_file)
+    if use_cache:
+        cached = _load_cached_token(TOKEN_CACHE_FILE, cache_key)
+        if cached:
+            return cached
+    
+    # Generate JWT (valid for 20 minutes)
+    if signer is None:
+        signer = prepare_signer(key_file)
+    exp = int(time.time()) + TOKEN_LIFETIME
+    token = signer(key_id, issuer_id, exp)
+    _store_cached_token(TOKEN_CACHE_FILE, cache_key, token, exp)
+    return token, exp
+
+
+def generate_token(key_id: str, issuer_id: str, key_file: str, use_cache: bool = True,
+                   signer: Optional[Callable[..., str]] = None) -> str:
     """
     Generate a JWT token for App Store Connect API authentication.
     
+    Reuses a previously signed token from TOKEN_CACHE_FILE while it has
+    more than two minutes of validity left.
+    
     Args:
         key_id: The Key ID from App Store Connect
         issuer_id: The Issuer ID from App Store Connect
         key_file: Path to the .p8 private key file
+        use_cache: Read and update the on-disk token cache
+        signer: Signing function from prepare_signer(key_file), reused across calls
         
     Returns:
         JWT token string
@@ -21,22 +220,55 @@ def generate_token(key_id: str, issuer_id: str, key_file: str) -> str:
         FileNotFoundError: If the key file doesn't exist
         ValueError: If the key file is invalid
     """
-    # Load private key
-    with open(key_file, 'rb') as f:
-        private_key = serialization.load_pem_private_key(f.read(), password=None)
+    return _sign_token(key_id, issuer_id, key_file, use_cache, signer)[0]
+
+
+def token_expiry(token: str) -> Optional[int]:
+    """
+    Return the exp claim (Unix time) of a token issued by get_valid_token.
     
-    # Generate JWT (valid for 20 minutes)
-    now = int(time.time())
-    payload = {
-        'iss': issuer_id,
-        'exp': now + 1200,  # 20 minutes
-        'aud': 'appstoreconnect-v1',
-    }
+    Args:
+        token: JWT token string returned by get_valid_token
+        
+    Returns:
+        Expiry timestamp, or None if the token wasn't issued in this process
+    """
+    for memo_token, exp in _TOKEN_MEMO.values():
+        if memo_token == token:
+            return exp
+    return None
+
+
+def get_valid_token(key_id: str, issuer_id: str, key_file: str, use_cache: bool = True,
+                    signer: Optional[Callable[..., str]] = None) -> str:
+    """
+    Return a JWT token, reusing one already issued in this process.
     
-    headers = {
-        'alg': 'ES256',
-        'kid': key_id,
-        'typ': 'JWT',
-    }
+    A memoized token is handed out until less than two minutes of its
+    20 minute lifetime remain, after which a new one is generated.
+    
+    Args:
+        key_id: The Key ID from App Store Connect
+        issuer_id: The Issuer ID from App Store Connect
+        key_file: Path to the .p8 private key file
+        use_cache: Reuse memoized and on-disk tokens
+        signer: Signing function from prepare_signer(key_file), reused across calls
+        
+    Returns:
+        JWT token string
+        
+    Raises:
+        FileNotFoundError: If the key file doesn't exist
+        ValueError: If the key file is invalid
+    """
+    memo_key = (key_id, issuer_id, key_file, os.stat(key_file).st_mtime_ns)
+    if use_cache:
+        memoized = _TOKEN_MEMO.get(memo_key)
+        if memoized and memoized[1] - time.time() > TOKEN_REFRESH_MARGIN:
+            return memoized[0]
     
-    return jwt.encode(payload, private_key, algorithm='ES256', headers=headers)
+    token, exp = _sign_token(key_id, issuer_id, key_file, use_cache, signer)
+    if len(_TOKEN_MEMO) >= 8:
+        _TOKEN_MEMO.clear()
+    _TOKEN_MEMO[memo_key] = (token, exp)
+    return token
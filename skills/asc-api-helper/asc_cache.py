@@ -0,0 +1,80 @@
+"""On-disk response cache for App Store Connect API GET requests."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional
+
+CACHE_DIR = os.path.expanduser('~/.axctl_asc_cache')
+
+
+def cache_key(url: str, params: Optional[dict] = None, scope: str = '') -> str:
+    """
+    Build the cache key for a request.
+    
+    Args:
+        url: Request URL (without query string)
+        params: Query parameters sent with the request
+        scope: Account identifier, so different accounts never share entries
+        
+    Returns:
+        Hex digest identifying the cache entry
+    """
+    query = '&'.join(f'{k}={v}' for k, v in sorted((params or {}).items()))
+    return hashlib.sha256(f'{scope}\0{url}?{query}'.encode()).hexdigest()
+
+
+def load(key: str) -> Optional[dict]:
+    """
+    Load a cache entry.
+    
+    Returns:
+        Dict with etag, last_modified, body and fetched_at keys,
+        or None if there is no usable entry
+    """
+    try:
+        with open(os.path.join(CACHE_DIR, f'{key}.json'), 'r') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(entry, dict) or 'body' not in entry:
+        return None
+    return entry
+
+
+def save(key: str, etag: Optional[str], last_modified: Optional[str], body: dict) -> None:
+    """
+    Atomically store a response body with its validators (owner-only permissions).
+    
+    Responses without an ETag or Last-Modified header are still stored so
+    they can be served within --max-age.
+    """
+    entry = {
+        'etag': etag,
+        'last_modified': last_modified,
+        'body': body,
+        'fetched_at': time.time(),
+    }
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix='.tmp_')
+    except OSError:
+        return
+    try:
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, os.path.join(CACHE_DIR, f'{key}.json'))
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def touch(key: str, entry: dict) -> None:
+    """Mark an entry as freshly validated (after a 304 response)."""
+    save(key, entry.get('etag'), entry.get('last_modified'), entry['body'])
@@ -16,6 +16,7 @@ Commands:
     list-apps   List running applications
     tree        Dump full accessibility tree
     press       Press a key (Return, Tab, etc.)
+    batch       Run a JSON list of actions against one app
 
 Exit Codes:
     0 - Success
@@ -28,46 +29,96 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
-# Import modules from the same package
-from ax_core import (
-    get_app_by_name,
-    serialize_element,
-    list_running_apps,
-)
-from ax_search import (
-    query_elements,
-    parse_element_path,
-)
-from ax_actions import (
-    perform_click,
-    perform_type,
-    perform_press_key,
-    get_value as ax_get_value,
-)
+# Optional: faster JSON encoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Modules from the same package (ax_core, ax_search, ax_actions) are imported
+# inside each command so a command only loads the PyObjC frameworks it uses
 
 
 def utc_now() -> str:
     """Return current UTC time as ISO string."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Formatted from time.gmtime() directly - no tz-aware datetime or strftime
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+    )
+
+
+def _json_default(value: Any) -> Any:
+    """Convert scalar subclasses orjson rejects (PyObjC NSNumber doubles are float subclasses)."""
+    for base in (float, int, str):
+        if isinstance(value, base):
+            return base(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value as indented JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_json_default, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # Anything else orjson can't encode: let json try it
+    return json.dumps(value, indent=2).encode()
+
+
+def write_json(data: dict[str, Any]) -> None:
+    """
+    Write data to stdout as indented JSON.
+    
+    List values (e.g. the element list from `tree`) are encoded one item at a
+    time, so the formatted output is never joined into a single string.
+    Everything is encoded before anything is written, so an encoding error
+    leaves stdout untouched. The layout matches json.dumps(data, indent=2);
+    with orjson installed, non-ASCII text is written as UTF-8 rather than
+    as \\u escapes.
+    """
+    chunks = [b"{"]
+    for i, (key, value) in enumerate(data.items()):
+        chunks.append((b",\n  " if i else b"\n  ") + _dumps(key) + b": ")
+        if isinstance(value, list) and value:
+            chunks.append(b"[")
+            for j, item in enumerate(value):
+                chunks.append((b",\n    " if j else b"\n    ") + _dumps(item).replace(b"\n", b"\n    "))
+            chunks.append(b"\n  ]")
+        else:
+            chunks.append(_dumps(value).replace(b"\n", b"\n  "))
+    chunks.append(b"\n}\n" if data else b"}\n")
+    
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    out.writelines(chunks)
+    out.flush()
 
 
 def exit_with_code(exit_code: int, data: dict[str, Any]) -> None:
     """Print JSON output and exit with given code."""
-    print(json.dumps(data, indent=2))
+    write_json(data)
     sys.exit(exit_code)
 
 
 def cmd_list_apps() -> dict[str, Any]:
     """List running applications."""
+    from ax_core import list_running_apps
     apps = list_running_apps()
     return {"apps": apps}
 
 
-def cmd_query(app_name: str, filters: list[str], max_depth: int) -> dict[str, Any]:
+def cmd_query(app_name: str, filters: list[str], max_depth: int,
+              skip_hidden: bool = False) -> dict[str, Any]:
     """Query elements in an application."""
+    from ax_core import get_app_by_name
+    from ax_search import query_elements
+    
     # Find the application
     app_element = get_app_by_name(app_name)
     if app_element is None:
@@ -83,13 +134,16 @@ def cmd_query(app_name: str, filters: list[str], max_depth: int) -> dict[str, An
             key, value = f.split("=", 1)
             filter_dict[key.strip()] = value.strip()
     
-    # Query elements
-    elements = query_elements(
-        app_element,
-        filter_dict,
-        max_depth=max_depth,
-        max_results=100,
-    )
+    # Query elements, overlapping each element's child fetches (blocking IPC)
+    with ThreadPoolExecutor(max_workers=4) as fetch_executor:
+        elements = query_elements(
+            app_element,
+            filter_dict,
+            max_depth=max_depth,
+            max_results=100,
+            skip_hidden=skip_hidden,
+            fetch_executor=fetch_executor,
+        )
     
     return {
         "app": app_name,
@@ -100,6 +154,10 @@ def cmd_query(app_name: str, filters: list[str], max_depth: int) -> dict[str, An
 
 def cmd_click(app_name: str, element_path: str) -> dict[str, Any]:
     """Click an element by path."""
+    from ax_core import get_app_by_name
+    from ax_search import parse_element_path
+    from ax_actions import perform_click
+    
     # Find the application
     app_element = get_app_by_name(app_name)
     if app_element is None:
@@ -140,6 +198,10 @@ def cmd_click(app_name: str, element_path: str) -> dict[str, Any]:
 
 def cmd_type(app_name: str, element_path: str, text: str) -> dict[str, Any]:
     """Type text into an element."""
+    from ax_core import get_app_by_name
+    from ax_search import parse_element_path
+    from ax_actions import perform_type
+    
     # Find the application
     app_element = get_app_by_name(app_name)
     if app_element is None:
@@ -182,6 +244,10 @@ def cmd_type(app_name: str, element_path: str, text: str) -> dict[str, Any]:
 
 def cmd_get_value(app_name: str, element_path: str) -> dict[str, Any]:
     """Get value from an element."""
+    from ax_core import get_app_by_name, serialize_element
+    from ax_search import parse_element_path
+    from ax_actions import get_value as ax_get_value
+    
     # Find the application
     app_element = get_app_by_name(app_name)
     if app_element is None:
@@ -210,8 +276,11 @@ def cmd_get_value(app_name: str, element_path: str) -> dict[str, Any]:
     }
 
 
-def cmd_tree(app_name: str, max_depth: int) -> dict[str, Any]:
+def cmd_tree(app_name: str, max_depth: int, skip_hidden: bool = False) -> dict[str, Any]:
     """Dump accessibility tree for an application."""
+    from ax_core import get_app_by_name
+    from ax_search import query_elements_parallel
+    
     # Find the application
     app_element = get_app_by_name(app_name)
     if app_element is None:
@@ -220,12 +289,14 @@ def cmd_tree(app_name: str, max_depth: int) -> dict[str, Any]:
             "app": app_name,
         })
     
-    # Query all elements up to max_depth (no filters = get everything)
-    elements = query_elements(
+    # Query all elements up to max_depth (no filters = get everything),
+    # walking top-level subtrees concurrently
+    elements = query_elements_parallel(
         app_element,
         {},  # No filters - get all elements
         max_depth=max_depth,
         max_results=500,
+        skip_hidden=skip_hidden,
     )
     
     return {
@@ -237,6 +308,9 @@ def cmd_tree(app_name: str, max_depth: int) -> dict[str, Any]:
 
 def cmd_press(app_name: str, key: str) -> dict[str, Any]:
     """Press a key in an application."""
+    from ax_core import get_app_by_name
+    from ax_actions import perform_press_key
+    
     # Find the application
     app_element = get_app_by_name(app_name)
     if app_element is None:
@@ -266,8 +340,111 @@ def cmd_press(app_name: str, key: str) -> dict[str, Any]:
         })
 
 
-def main() -> None:
-    """Main entry point."""
+def _run_batch_action(app_element: Any, op: Any) -> dict[str, Any]:
+    """Run a single batch action and return its result entry."""
+    from ax_search import parse_element_path
+    from ax_actions import (
+        perform_click,
+        perform_type,
+        perform_press_key,
+        get_value as ax_get_value,
+    )
+    
+    if not isinstance(op, dict):
+        return {"success": False, "error": "Batch entry must be an object"}
+    
+    action = op.get("action")
+    path = op.get("path")
+    result: dict[str, Any] = {"action": action}
+    if path:
+        result["element"] = path
+    
+    if action not in ("click", "type", "get-value", "press"):
+        result.update(success=False, error=f"Unknown action: {action}")
+        return result
+    
+    # Resolve the target element (press may target the app itself)
+    if path:
+        element = parse_element_path(app_element, path)
+        if element is None:
+            result.update(success=False, error=f"Element not found: {path}")
+            return result
+    elif action == "press":
+        element = app_element
+    else:
+        result.update(success=False, error=f"Action '{action}' requires a path")
+        return result
+    
+    if action == "click":
+        success = perform_click(element)
+    elif action == "type":
+        text = op.get("text")
+        result["text"] = text
+        success = perform_type(element, text)
+    elif action == "get-value":
+        result["value"] = ax_get_value(element)
+        success = True
+    else:
+        key = op.get("key", "")
+        result["key"] = key
+        success = perform_press_key(element, key)
+    
+    result["success"] = success
+    if not success:
+        result["error"] = f"{action} action failed"
+    return result
+
+
+def cmd_batch(app_name: str, batch_file: str) -> dict[str, Any]:
+    """Run a list of actions against one application in a single process."""
+    from ax_core import get_app_by_name
+    
+    # Load actions: [{"action": "type", "path": "window[0].textfield[0]", "text": "..."}, ...]
+    try:
+        if batch_file == "-":
+            actions = json.load(sys.stdin)
+        else:
+            with open(batch_file, "r") as f:
+                actions = json.load(f)
+    except (OSError, ValueError) as e:
+        exit_with_code(1, {
+            "error": f"Could not read batch file: {e}",
+            "action": "batch",
+        })
+    
+    if not isinstance(actions, list):
+        exit_with_code(1, {
+            "error": "Batch file must contain a JSON list of actions",
+            "action": "batch",
+        })
+    
+    # Find the application once for every action
+    app_element = get_app_by_name(app_name)
+    if app_element is None:
+        exit_with_code(2, {
+            "error": f"Application '{app_name}' not found",
+            "app": app_name,
+            "action": "batch",
+        })
+    
+    results = [_run_batch_action(app_element, op) for op in actions]
+    success = all(r["success"] for r in results)
+    
+    data = {
+        "success": success,
+        "app": app_name,
+        "action": "batch",
+        "results": results,
+        "count": len(results),
+        "timestamp": utc_now(),
+    }
+    if not success:
+        exit_with_code(1, data)
+    return data
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with all subcommands."""
     parser = argparse.ArgumentParser(
         description="AX Helper - macOS Accessibility Automation CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -294,6 +471,11 @@ def main() -> None:
         default=10,
         help="Maximum depth to traverse (default: 10)",
     )
+    query_parser.add_argument(
+        "--skip-hidden",
+        action="store_true",
+        help="Don't search inside hidden elements (AXHidden)",
+    )
     
     # click command
     click_parser = subparsers.add_parser("click", help="Click an element")
@@ -320,16 +502,38 @@ def main() -> None:
         default=5,
         help="Maximum depth (default: 5)",
     )
+    tree_parser.add_argument(
+        "--skip-hidden",
+        action="store_true",
+        help="Don't descend into hidden elements (AXHidden)",
+    )
     
     # press command
     press_parser = subparsers.add_parser("press", help="Press a key")
     press_parser.add_argument("app", help="Application name")
     press_parser.add_argument("key", help="Key to press (Return, Tab, Escape, etc.)")
     
-    args = parser.parse_args()
+    # batch command
+    batch_parser = subparsers.add_parser("batch", help="Run a JSON list of actions")
+    batch_parser.add_argument("app", help="Application name")
+    batch_parser.add_argument(
+        "file",
+        help='JSON file of [{"action", "path", "text"|"key"}] entries, or - for stdin',
+    )
+    
+    return parser
+
+
+def main() -> None:
+    """Main entry point."""
+    # list-apps takes no arguments - skip building the subparsers
+    if sys.argv[1:] == ["list-apps"]:
+        args = argparse.Namespace(command="list-apps")
+    else:
+        args = build_parser().parse_args()
     
     if args.command is None:
-        parser.print_help()
+        build_parser().print_help()
         sys.exit(1)
     
     try:
@@ -339,7 +543,7 @@ def main() -> None:
             result = cmd_list_apps()
         
         elif args.command == "query":
-            result = cmd_query(args.app, args.filter, args.max_depth)
+            result = cmd_query(args.app, args.filter, args.max_depth, args.skip_hidden)
         
         elif args.command == "click":
             result = cmd_click(args.app, args.path)
@@ -351,18 +555,21 @@ def main() -> None:
             result = cmd_get_value(args.app, args.path)
         
         elif args.command == "tree":
-            result = cmd_tree(args.app, args.max_depth)
+            result = cmd_tree(args.app, args.max_depth, args.skip_hidden)
         
         elif args.command == "press":
             result = cmd_press(args.app, args.key)
         
+        elif args.command == "batch":
+            result = cmd_batch(args.app, args.file)
+        
         else:
-            parser.print_help()
+            build_parser().print_help()
             sys.exit(1)
         
         # Success - exit code 0
         exit_with_code(0, result)
-        
+    
     except Exception as e:
         # Unexpected error - exit code 1
         exit_with_code(1, {
@@ -11,6 +11,11 @@ Functions:
     - perform_press_key(element, key): Press key using CGEventPost
     - perform_focus(element): Set AXFocused to True
     - get_value(element): Read AXValue from element
+    - get_values(element, attrs): Read several attributes in one call
+    - clear_ax_cache(): Drop cached get_value() reads and ax_search lookups
+    - perform_bulk(actions): Run a sequence of actions in one call
+    - fill_field(element, text): Focus, set value and optionally press Return
+    - perform_double_click_at(x, y): Double-click at screen coordinates
 
 Requirements:
     - Python 3.9+
@@ -22,8 +27,15 @@ License: MIT
 
 from __future__ import annotations
 
+import array
+import ctypes
+import ctypes.util
+import functools
 import logging
+import os
+import sys
 import time
+from types import MappingProxyType
 from typing import Any, Optional
 
 # PyObjC imports for macOS Accessibility APIs
@@ -34,6 +46,8 @@ from Quartz.CoreGraphics import (
     CGEventCreateMouseEvent,
     CGEventSetFlags,
     CGEventSetIntegerValueField,
+    CGEventSetLocation,
+    CGEventSourceCreate,
     kCGEventSourceStateHIDSystemState,
     kCGHIDEventTap,
 )
@@ -41,26 +55,53 @@ from Quartz.CoreGraphics import (
 # ApplicationServices imports for AX actions
 from ApplicationServices import (
     AXUIElementCopyAttributeValue,
+    AXUIElementCopyMultipleAttributeValues,
     AXUIElementSetAttributeValue,
     AXUIElementPerformAction,
+    AXValueGetType,
+    AXValueGetValue,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.WARNING,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Try to import AXValue type constants, fallback to values if unavailable
+try:
+    from ApplicationServices import (
+        kAXValueTypeCGPoint,
+        kAXValueTypeCGSize,
+    )
+except ImportError:
+    # Fallback values (these are the enum values)
+    kAXValueTypeCGPoint = 1  # kAXValueCGPointType
+    kAXValueTypeCGSize = 2   # kAXValueCGSizeType
+
+from ax_core import _AXKey, _is_ax_error
+
+# Logging is configured by the application; messages use lazy %-formatting
 logger = logging.getLogger(__name__)
 
 # Type aliases for clarity
 AXUIElement = Any  # AXUIElementRef is an opaque type
 
+# Short-lived cache of get_value() reads: (_AXKey(element), attribute) -> (value, time).
+# Cleared by every action that can change element state.
+_ATTR_CACHE_TTL = 0.05  # seconds
+_ATTR_CACHE_MAX = 4096
+_ATTR_CACHE: dict[tuple[_AXKey, str], tuple[Any, float]] = {}
+
+# Checked once: skips the debug call entirely on the get_value hot path
+_LOG_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+# One HID-state event source shared by every synthesized key/mouse event,
+# instead of letting CoreGraphics set one up per event
+_EVENT_SOURCE = CGEventSourceCreate(kCGEventSourceStateHIDSystemState)
+
 # Try to import AX constants, fallback to strings if unavailable
 try:
     from ApplicationServices import (
         kAXRoleAttribute,
         kAXValueAttribute,
         kAXFocusedAttribute,
+        kAXPositionAttribute,
+        kAXSizeAttribute,
         kAXPressAction,
         kAXRaiseAction,
         kAXPress,
@@ -72,12 +113,50 @@ except ImportError:
     kAXRoleAttribute = "AXRole"
     kAXValueAttribute = "AXValue"
     kAXFocusedAttribute = "AXFocused"
+    kAXPositionAttribute = "AXPosition"
+    kAXSizeAttribute = "AXSize"
     kAXPressAction = "AXPress"
     kAXRaiseAction = "AXRaise"
     kAXPress = "AXPress"
 
-# Key code mapping for common keys
-KEY_CODES = {
+# Action names resolved once at import (the fallbacks above are the same strings)
+_PRESS_ACTION = kAXPressAction if _AX_CONSTANTS_AVAILABLE else kAXPress
+_RAISE_ACTION = kAXRaiseAction
+
+# Action to use when AXPress is rejected, for roles that don't support it
+_ROLE_FALLBACK_ACTIONS = {
+    "AXWindow": _RAISE_ACTION,
+    "AXSheet": _RAISE_ACTION,
+    "AXDrawer": _RAISE_ACTION,
+    "AXMenuItem": "AXPick",
+    "AXMenuBarItem": "AXPick",
+}
+
+
+
+def _env_delay(name: str) -> float:
+    """Read a delay in seconds from the environment (0 if unset or invalid)."""
+    try:
+        return max(0.0, float(os.environ.get(name, "0")))
+    except ValueError:
+        return 0.0
+
+
+# Optional waits, off by default: events posted to the HID tap are
+# delivered in order, so no sleep is needed between them. Set these
+# for apps that need time to react (e.g. AXCTL_POST_SET_DELAY=0.05).
+_INTER_EVENT_DELAY = _env_delay("AXCTL_INTER_EVENT_DELAY")  # between posted events
+_POST_SET_DELAY = _env_delay("AXCTL_POST_SET_DELAY")  # after setting focus/value
+
+
+def _pause(delay: float) -> None:
+    """Sleep only when a delay has been configured."""
+    if delay > 0:
+        time.sleep(delay)
+
+
+# Key code mapping for common keys (read-only)
+KEY_CODES = MappingProxyType({
     "return": 0x24,
     "enter": 0x24,
     "tab": 0x30,
@@ -105,7 +184,142 @@ KEY_CODES = {
     "f10": 0x6D,
     "f11": 0x67,
     "f12": 0x6F,
-}
+})
+
+
+# Named keys pre-resolved to (keycode, event flags, unicode char)
+_NAMED_KEYS = {name: (keycode, 0, None) for name, keycode in KEY_CODES.items()}
+
+_SHIFT_FLAG = 0x20000  # kCGEventFlagMaskShift
+
+
+@functools.lru_cache(maxsize=1)
+def _layout_keymap() -> dict[str, tuple[int, bool]]:
+    """
+    Map printable ASCII characters to (keycode, needs_shift) for the
+    current keyboard layout, using TIS + UCKeyTranslate via ctypes.
+    
+    Built on first use. Returns an empty dict if the layout can't be read,
+    in which case characters are sent as Unicode strings instead.
+    """
+    carbon_path = ctypes.util.find_library("Carbon")
+    cf_path = ctypes.util.find_library("CoreFoundation")
+    if not carbon_path or not cf_path:
+        return {}
+    
+    keymap: dict[str, tuple[int, bool]] = {}
+    try:
+        carbon = ctypes.cdll.LoadLibrary(carbon_path)
+        cf = ctypes.cdll.LoadLibrary(cf_path)
+        
+        carbon.TISCopyCurrentKeyboardLayoutInputSource.restype = ctypes.c_void_p
+        carbon.TISGetInputSourceProperty.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        carbon.TISGetInputSourceProperty.restype = ctypes.c_void_p
+        carbon.LMGetKbdType.restype = ctypes.c_uint8
+        carbon.UCKeyTranslate.argtypes = [
+            ctypes.c_void_p,                   # keyLayoutPtr
+            ctypes.c_uint16,                   # virtualKeyCode
+            ctypes.c_uint16,                   # keyAction
+            ctypes.c_uint32,                   # modifierKeyState
+            ctypes.c_uint32,                   # keyboardType
+            ctypes.c_uint32,                   # keyTranslateOptions
+            ctypes.POINTER(ctypes.c_uint32),   # deadKeyState
+            ctypes.c_ulong,                    # maxStringLength
+            ctypes.POINTER(ctypes.c_ulong),    # actualStringLength
+            ctypes.POINTER(ctypes.c_uint16),   # unicodeString
+        ]
+        carbon.UCKeyTranslate.restype = ctypes.c_int32
+        cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+        cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        
+        source = carbon.TISCopyCurrentKeyboardLayoutInputSource()
+        if not source:
+            return {}
+        try:
+            layout_prop = ctypes.c_void_p.in_dll(carbon, "kTISPropertyUnicodeKeyLayoutData")
+            layout_data = carbon.TISGetInputSourceProperty(source, layout_prop)
+            if not layout_data:
+                return {}
+            layout = cf.CFDataGetBytePtr(layout_data)
+            kbd_type = carbon.LMGetKbdType()
+            
+            dead_key_state = ctypes.c_uint32()
+            length = ctypes.c_ulong()
+            chars = (ctypes.c_uint16 * 4)()
+            # Unshifted first, so a character reachable both ways maps without Shift
+            for shift in (False, True):
+                modifiers = 0x02 if shift else 0  # (shiftKey >> 8)
+                for keycode in range(128):
+                    dead_key_state.value = 0
+                    status = carbon.UCKeyTranslate(
+                        layout, keycode, 0, modifiers, kbd_type,
+                        1,  # kUCKeyTranslateNoDeadKeysMask
+                        ctypes.byref(dead_key_state), len(chars), ctypes.byref(length), chars,
+                    )
+                    if status == 0 and length.value == 1:
+                        char = chr(chars[0])
+                        if " " < char <= "~" and char not in keymap:
+                            keymap[char] = (keycode, shift)
+        finally:
+            cf.CFRelease(source)
+            
+    except (OSError, AttributeError, ValueError) as e:
+        logger.debug("Could not read keyboard layout: %s", e)
+        return {}
+    
+    return keymap
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_key(key: str) -> tuple[int, int, Optional[str]]:
+    """
+    Resolve a key name to (keycode, event flags, unicode char).
+    
+    Named keys map to their virtual keycode. Single characters use the
+    keycode (plus Shift) from the current keyboard layout where one
+    exists, so apps see a real keystroke; anything else (e.g. emoji) is
+    sent as a Unicode string. Cached, so repeated keys skip normalization.
+    
+    Raises:
+        KeyError: If the key is neither a named key nor a single character.
+    """
+    entry = _NAMED_KEYS.get(key.lower().strip())
+    if entry is not None:
+        return entry
+    
+    char = key.strip()
+    if len(char) != 1:
+        raise KeyError(key)
+    
+    mapped = _layout_keymap().get(char)
+    if mapped is not None:
+        keycode, shift = mapped
+        return keycode, _SHIFT_FLAG if shift else 0, None
+    return 0, 0, char
+
+
+# Attribute sets read together with get_values() (one AX round-trip each)
+_FOCUS_VERIFY_ATTRS = (kAXFocusedAttribute, kAXRoleAttribute)
+_FRAME_ATTRS = (kAXPositionAttribute, kAXSizeAttribute)
+
+
+def clear_ax_cache() -> None:
+    """Drop all cached attribute reads, including ax_search's cached lookups."""
+    _ATTR_CACHE.clear()
+    
+    # Actions change the UI, so searches must not reuse pre-action results.
+    # ax_search is only consulted if loaded: otherwise it has nothing cached
+    ax_search = sys.modules.get("ax_search")
+    if ax_search is not None:
+        ax_search.invalidate_cache()
+
+
+def _cache_attr(element: AXUIElement, attr: str, value: Any) -> None:
+    """Store an attribute read, evicting the oldest entry when full."""
+    if len(_ATTR_CACHE) >= _ATTR_CACHE_MAX:
+        del _ATTR_CACHE[next(iter(_ATTR_CACHE))]
+    _ATTR_CACHE[(_AXKey(element), attr)] = (value, time.monotonic())
 
 
 def get_value(element: AXUIElement) -> Optional[Any]:
@@ -113,7 +327,8 @@ def get_value(element: AXUIElement) -> Optional[Any]:
     Read the AXValue attribute from an element.
     
     Retrieves the current value of an accessibility element,
-    which varies by element type:
+    which varies by element type (repeat reads within 50 ms are
+    served from a cache that every action clears):
     - Text fields: the text content
     - Sliders: the numeric value
     - Checkboxes: "AXValue" can be "true" or "false"
@@ -135,24 +350,96 @@ def get_value(element: AXUIElement) -> Optional[Any]:
         return None
     
     try:
+        cached = _ATTR_CACHE.get((_AXKey(element), kAXValueAttribute))
+        if cached is not None and time.monotonic() - cached[1] < _ATTR_CACHE_TTL:
+            return cached[0]
+        
         err, value = AXUIElementCopyAttributeValue(element, kAXValueAttribute, None)
         if err != 0:
-            logger.debug(f"Error getting AXValue: error code {err}")
+            logger.debug("Error getting AXValue: error code %s", err)
             return None
         
+        _cache_attr(element, kAXValueAttribute, value)
+        
         if value is None:
             return None
         
         # Return the value in its native type
         # Could be str, int, float, bool, or None
-        logger.debug(f"Got AXValue: {value}")
+        if _LOG_DEBUG:
+            logger.debug("Got AXValue: %s", value)
         return value
         
     except Exception as e:
-        logger.error(f"Error getting element value: {e}")
+        logger.error("Error getting element value: %s", e)
         return None
 
 
+def get_values(element: AXUIElement, attrs: tuple[str, ...]) -> dict[str, Optional[Any]]:
+    """
+    Read several attributes from an element in one accessibility call.
+    
+    Uses AXUIElementCopyMultipleAttributeValues, so reading N attributes
+    costs one round-trip to the accessibility server instead of N.
+    
+    Args:
+        element: The AXUIElement to read from.
+        attrs: Attribute names to read (e.g. kAXValueAttribute).
+    
+    Returns:
+        Dict mapping each requested attribute to its value (None if the
+        element doesn't provide it), or an empty dict on error.
+    
+    Example:
+        >>> values = get_values(text_field, (kAXValueAttribute, kAXFocusedAttribute))
+        >>> if values.get(kAXFocusedAttribute):
+        ...     print(f"Focused, text: {values[kAXValueAttribute]}")
+    """
+    if element is None:
+        logger.warning("Cannot get values from None element")
+        return {}
+    
+    try:
+        err, values = AXUIElementCopyMultipleAttributeValues(element, attrs, 0, None)
+        if err != 0 or values is None:
+            logger.debug("Error getting attributes %s: error code %s", attrs, err)
+            return {}
+        
+        # Missing attributes come back as AXError values in their slot
+        return {
+            attr: None if _is_ax_error(value) else value
+            for attr, value in zip(attrs, values)
+        }
+        
+    except Exception as e:
+        logger.error("Error getting element values: %s", e)
+        return {}
+
+
+def _element_center(element: AXUIElement) -> Optional[tuple[float, float]]:
+    """Return the screen coordinates of an element's center, or None."""
+    values = get_values(element, _FRAME_ATTRS)
+    position = values.get(kAXPositionAttribute)
+    size = values.get(kAXSizeAttribute)
+    
+    # AXPosition/AXSize are AXValueRefs wrapping a CGPoint/CGSize. Checking
+    # the wrapped type up front leaves nothing to catch when unwrapping.
+    if position is None or AXValueGetType(position) != kAXValueTypeCGPoint:
+        return None
+    
+    success, point = AXValueGetValue(position, kAXValueTypeCGPoint, None)
+    if not success:
+        return None
+    x, y = point.x, point.y
+    
+    if size is not None and AXValueGetType(size) == kAXValueTypeCGSize:
+        success, sz = AXValueGetValue(size, kAXValueTypeCGSize, None)
+        if success:
+            x += sz.width / 2
+            y += sz.height / 2
+    return x, y
+
+
 def perform_click(element: AXUIElement) -> bool:
     """
     Trigger the AXPress action on an element.
@@ -183,32 +470,39 @@ def perform_click(element: AXUIElement) -> bool:
         return False
     
     try:
-        # Determine the action to use
-        action = kAXPressAction if _AX_CONSTANTS_AVAILABLE else kAXPress
+        # Anything read before this action may be stale afterwards
+        clear_ax_cache()
         
         # Try to perform the press action
-        err = AXUIElementPerformAction(element, action)
+        err = AXUIElementPerformAction(element, _PRESS_ACTION)
         
         if err != 0:
-            logger.debug(f"AXPress action failed with error code: {err}")
-            # Try alternative: use AXRaise to bring element into view
-            # and then try again
-            try:
-                AXUIElementPerformAction(element, kAXRaiseAction)
-            except Exception:
-                pass
-            # Try again after raise
-            err = AXUIElementPerformAction(element, action)
+            logger.debug("AXPress action failed with error code: %s", err)
+            
+            # Roles with a known alternative action get just that action
+            _, role = AXUIElementCopyAttributeValue(element, kAXRoleAttribute, None)
+            fallback_action = _ROLE_FALLBACK_ACTIONS.get(role)
+            if fallback_action is not None:
+                err = AXUIElementPerformAction(element, fallback_action)
+            else:
+                # Try alternative: use AXRaise to bring element into view
+                # and then try again
+                try:
+                    AXUIElementPerformAction(element, _RAISE_ACTION)
+                except Exception:
+                    pass
+                # Try again after raise
+                err = AXUIElementPerformAction(element, _PRESS_ACTION)
             
             if err != 0:
-                logger.error(f"Failed to perform click: error code {err}")
+                logger.error("Failed to perform click: error code %s", err)
                 return False
         
         logger.info("Successfully clicked element")
         return True
         
     except Exception as e:
-        logger.error(f"Error performing click: {e}")
+        logger.error("Error performing click: %s", e)
         return False
 
 
@@ -230,25 +524,21 @@ def perform_raise(element: AXUIElement) -> bool:
         return False
     
     try:
-        if _AX_CONSTANTS_AVAILABLE:
-            err = AXUIElementPerformAction(element, kAXRaiseAction)
-        else:
-            # Fallback: try with string
-            err = AXUIElementPerformAction(element, "AXRaise")
+        err = AXUIElementPerformAction(element, _RAISE_ACTION)
         
         if err != 0:
-            logger.debug(f"AXRaise action failed: error code {err}")
+            logger.debug("AXRaise action failed: error code %s", err)
             return False
         
         logger.info("Successfully raised element")
         return True
         
     except Exception as e:
-        logger.error(f"Error raising element: {e}")
+        logger.error("Error raising element: %s", e)
         return False
 
 
-def perform_focus(element: AXUIElement) -> bool:
+def perform_focus(element: AXUIElement, verify: bool = False) -> bool:
     """
     Set focus to an accessibility element.
     
@@ -258,6 +548,7 @@ def perform_focus(element: AXUIElement) -> bool:
     
     Args:
         element: The AXUIElement to focus.
+        verify: Read AXFocused back afterwards and log if it didn't stick.
     
     Returns:
         True if focus was set successfully, False otherwise.
@@ -276,30 +567,31 @@ def perform_focus(element: AXUIElement) -> bool:
     
     try:
         # Set AXFocused to True
-        if _AX_CONSTANTS_AVAILABLE:
-            err = AXUIElementSetAttributeValue(element, kAXFocusedAttribute, True)
-        else:
-            err = AXUIElementSetAttributeValue(element, "AXFocused", True)
+        err = AXUIElementSetAttributeValue(element, kAXFocusedAttribute, True)
         
         if err != 0:
-            logger.error(f"Failed to set focus: error code {err}")
+            logger.error("Failed to set focus: error code %s", err)
             return False
         
-        # Verify focus was set
-        err, is_focused = AXUIElementCopyAttributeValue(element, kAXFocusedAttribute, None)
-        if err != 0 or not is_focused:
-            logger.warning(f"Focus set but element reports as not focused")
-            # Don't return False - the set might have worked even if verify fails
+        # Verify focus was set (AXFocused + AXRole in one call)
+        if verify:
+            values = get_values(element, _FOCUS_VERIFY_ATTRS)
+            if not values.get(kAXFocusedAttribute):
+                logger.warning(
+                    "Focus set but %s element reports as not focused", values.get(kAXRoleAttribute)
+                )
+                # Don't return False - the set might have worked even if verify fails
         
         logger.info("Successfully focused element")
         return True
         
     except Exception as e:
-        logger.error(f"Error setting focus: {e}")
+        logger.error("Error setting focus: %s", e)
         return False
 
 
-def perform_type(element: AXUIElement, text: str) -> bool:
+def perform_type(element: AXUIElement, text: str, *, focus: bool = True,
+                 verify: bool = False) -> bool:
     """
     Set the value of an element to a text string.
     
@@ -307,9 +599,14 @@ def perform_type(element: AXUIElement, text: str) -> bool:
     provided text string. This is the most reliable way to
     input text into text fields.
     
+    By default this is two AX writes (AXFocused, AXValue) and no reads;
+    pass focus=False when the element is known to be focused already.
+    
     Args:
         element: The AXUIElement (typically a text field) to type into.
         text: The text string to insert.
+        focus: Focus the element first (skip if it is already focused).
+        verify: Read AXValue back afterwards and log if it came back empty.
     
     Returns:
         True if text was set successfully, False otherwise.
@@ -332,36 +629,71 @@ def perform_type(element: AXUIElement, text: str) -> bool:
         return False
     
     try:
+        clear_ax_cache()
+        
         # First, try to focus the element
-        perform_focus(element)
+        if focus:
+            perform_focus(element)
         
         # Set the value directly via AXValue attribute
-        if _AX_CONSTANTS_AVAILABLE:
-            err = AXUIElementSetAttributeValue(element, kAXValueAttribute, text)
-        else:
-            err = AXUIElementSetAttributeValue(element, "AXValue", text)
+        err = AXUIElementSetAttributeValue(element, kAXValueAttribute, text)
         
         if err != 0:
-            logger.error(f"Failed to set text value: error code {err}")
+            logger.error("Failed to set text value: error code %s", err)
             return False
         
-        # Small delay to allow the value to be set
-        time.sleep(0.05)
-        
         # Verify the value was set
-        current_value = get_value(element)
-        if current_value is None:
-            logger.warning("Value set but readback returned None")
+        if verify:
+            _pause(_POST_SET_DELAY)
+            if get_value(element) is None:
+                logger.warning("Value set but readback returned None")
         
-        logger.info(f"Successfully typed text: {text[:20]}{'...' if len(text) > 20 else ''}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Successfully typed text: %.20s%s", text, "..." if len(text) > 20 else "")
         return True
         
     except Exception as e:
-        logger.error(f"Error typing text: {e}")
+        logger.error("Error typing text: %s", e)
         return False
 
 
-def perform_press_key(element: AXUIElement, key: str) -> bool:
+@functools.lru_cache(maxsize=128)
+def _key_events(keycode: int, flags: int, char: Optional[str]) -> tuple[Any, Any]:
+    """
+    Build (and cache) the key down/up events for a key.
+    
+    CGEventPost doesn't consume the event, so the same pair is re-posted
+    on every press: two PyObjC calls per key instead of four to six.
+    
+    Raises:
+        RuntimeError: If CoreGraphics can't create the events.
+    """
+    # Create key down event
+    key_down = CGEventCreateKeyboardEvent(_EVENT_SOURCE, keycode, True)
+    if key_down is None:
+        raise RuntimeError("Failed to create key down event")
+    
+    # Create key up event
+    key_up = CGEventCreateKeyboardEvent(_EVENT_SOURCE, keycode, False)
+    if key_up is None:
+        raise RuntimeError("Failed to create key up event")
+    
+    # Modifiers (Shift for layout-mapped characters)
+    if flags:
+        CGEventSetFlags(key_down, flags)
+        CGEventSetFlags(key_up, flags)
+    
+    # For unmapped characters, use CGEventKeyboardSetUnicodeString on both events.
+    # One UTF-16 buffer serves both (and covers characters outside the BMP)
+    if char is not None:
+        units = array.array("H", char.encode("utf-16-le"))
+        CGEventKeyboardSetUnicodeString(key_down, len(units), units)
+        CGEventKeyboardSetUnicodeString(key_up, len(units), units)
+    
+    return key_down, key_up
+
+
+def perform_press_key(element: AXUIElement, key: str, focus: bool = True) -> bool:
     """
     Press a key using CGEvent keyboard simulation.
     
@@ -380,7 +712,9 @@ def perform_press_key(element: AXUIElement, key: str) -> bool:
               "escape", "backspace", "up", "down", "left", "right",
               "home", "end", "pageup", "pagedown"
             - Function keys: "f1" through "f12"
-            - Single characters: "a", "1", etc. (uses Unicode)
+            - Single characters: "a", "A", "1", etc. (keycode from the
+              current keyboard layout, or Unicode if it has none)
+        focus: Focus the element first (skip if it is already focused).
     
     Returns:
         True if the key press was successful, False otherwise.
@@ -396,132 +730,246 @@ def perform_press_key(element: AXUIElement, key: str) -> bool:
         >>> success = perform_press_key(None, "escape")
     """
     try:
+        clear_ax_cache()
+        
         # Try to focus the element first (if provided)
-        if element is not None:
+        if element is not None and focus:
             perform_focus(element)
-        
-        # Small delay to ensure focus is set
-        time.sleep(0.05)
+            _pause(_POST_SET_DELAY)
         
         # Resolve key to keycode
-        key_lower = key.lower().strip()
-        
-        # Check if it's a named key
-        if key_lower in KEY_CODES:
-            keycode = KEY_CODES[key_lower]
-            use_unicode = False
-        elif len(key_lower) == 1:
-            # Single character - use Unicode string for arbitrary characters
-            keycode = 0
-            use_unicode = True
-            char = key_lower
-        else:
-            logger.error(f"Unknown key: {key}")
+        try:
+            # Already-normalized names ("return") hit the table directly
+            keycode, flags, char = _NAMED_KEYS.get(key) or _resolve_key(key)
+        except KeyError:
+            logger.error("Unknown key: %s", key)
             return False
         
-        # Create keyboard event source
-        # Use None for HID system-wide event
-        event_source = None
+        key_down, key_up = _key_events(keycode, flags, char)
         
-        # Create key down event
-        key_down = CGEventCreateKeyboardEvent(event_source, keycode, True)
-        if key_down is None:
-            logger.error("Failed to create key down event")
-            return False
+        # Post the events (key down then key up)
+        CGEventPost(0, key_down)  # 0 = kCGHIDEventTap
+        _pause(_INTER_EVENT_DELAY)
+        CGEventPost(0, key_up)
+        
+        logger.info("Successfully pressed key: %s", key)
+        return True
         
-        # For single characters, use CGEventKeyboardSetUnicodeString
-        if use_unicode:
-            CGEventKeyboardSetUnicodeString(key_down, 1, [ord(char)])
+    except Exception as e:
+        logger.error("Error pressing key: %s", e)
+        return False
+
+
+def perform_press_keys(element: AXUIElement, keys: list[str], focus: bool = True) -> bool:
+    """
+    Press a sequence of keys using CGEvent keyboard simulation.
+    
+    All keys are resolved and their events built before anything is
+    posted, so an unknown key fails the whole sequence without sending a
+    partial one, and the posting loop makes only the CGEventPost calls.
+    
+    Args:
+        element: The AXUIElement (used for focusing if needed, can be None).
+        keys: Keys to press in order, as accepted by perform_press_key().
+        focus: Focus the element first (skip if it is already focused).
+    
+    Returns:
+        True if all key presses were successful, False otherwise.
+    
+    Example:
+        >>> success = perform_press_keys(text_field, ["down", "down", "return"])
+    """
+    try:
+        clear_ax_cache()
         
-        # Create key up event
-        key_up = CGEventCreateKeyboardEvent(event_source, keycode, False)
-        if key_up is None:
-            logger.error("Failed to create key up event")
-            return False
+        # Resolve every key up front
+        events = []
+        for key in keys:
+            try:
+                keycode, flags, char = _NAMED_KEYS.get(key) or _resolve_key(key)
+            except KeyError:
+                logger.error("Unknown key: %s", key)
+                return False
+            events.append(_key_events(keycode, flags, char))
         
-        # For single characters, use CGEventKeyboardSetUnicodeString on key up too
-        if use_unicode:
-            CGEventKeyboardSetUnicodeString(key_up, 1, [ord(char)])
+        if element is not None and focus:
+            perform_focus(element)
+            _pause(_POST_SET_DELAY)
         
-        # Post the events (key down then key up)
-        CGEventPost(0, key_down)  # 0 = kCGHIDEventTap
-        time.sleep(0.01)  # Small delay between down and up
-        CGEventPost(0, key_up)
+        post = CGEventPost
+        delay = _INTER_EVENT_DELAY
+        for key_down, key_up in events:
+            post(0, key_down)  # 0 = kCGHIDEventTap
+            if delay:
+                time.sleep(delay)
+            post(0, key_up)
         
-        logger.info(f"Successfully pressed key: {key}")
+        logger.info("Successfully pressed %s keys", len(events))
         return True
         
     except Exception as e:
-        logger.error(f"Error pressing key: {e}")
+        logger.error("Error pressing keys: %s", e)
         return False
 
 
-def perform_double_click(element: AXUIElement) -> bool:
+def fill_field(element: AXUIElement, text: str, *, submit: bool = False,
+               verify: bool = False) -> bool:
     """
-    Perform a double-click action on an element.
+    Fill a form field: focus it, set its value, and optionally submit.
     
-    Simulates a double-click using CGEvent with clickCount=2.
-    Useful for opening files, folders, or items
-    that require double-click to activate.
+    Equivalent to perform_focus + perform_type + perform_press_key("return")
+    but done as two AX writes and (with submit) one cached Return key pair.
     
     Args:
-        element: The AXUIElement to double-click.
+        element: The AXUIElement (typically a text field) to fill.
+        text: The text string to insert.
+        submit: Press Return after setting the value.
+        verify: Read AXValue back afterwards and log if it came back empty.
     
     Returns:
-        True if successful, False otherwise.
+        True if the value was set (and Return posted), False otherwise.
+    
+    Example:
+        >>> search = find_element_by_path(app, "window[0].textfield[0]")
+        >>> fill_field(search, "accessibility", submit=True)
+        True
     """
     if element is None:
-        logger.warning("Cannot double-click None element")
+        logger.warning("Cannot fill None element")
+        return False
+    
+    if text is None:
+        logger.warning("Cannot fill None text")
         return False
     
     try:
-        # Get the position of the element
-        err, position = AXUIElementCopyAttributeValue(element, "AXPosition", None)
+        clear_ax_cache()
+        
+        # Focus failure isn't fatal - many fields accept a value anyway
+        err = AXUIElementSetAttributeValue(element, kAXFocusedAttribute, True)
         if err != 0:
-            logger.error(f"Could not get element position: {err}")
-            return perform_click(element)  # Fallback to single click
+            logger.debug("Failed to set focus before fill: error code %s", err)
         
-        # Extract x, y from position (it's a CGPoint)
-        try:
-            x = position.x
-            y = position.y
-        except AttributeError:
-            # Position might be a tuple or list
-            x, y = position
-        
-        # Create mouse events for double-click
-        event_source = None
-        
-        # Create left mouse down event with clickCount=2
-        mouse_down = CGEventCreateMouseEvent(
-            event_source,  # source
-            0x01,         # kCGEventLeftMouseDown
-            (x, y),       # location
-            0             # kCGMouseButtonLeft (0 = left button)
-        )
-        CGEventSetIntegerValueField(mouse_down, 0x0A, 2)  # kCGMouseEventClickState = 2 for double-click
-        
-        # Create left mouse up event with clickCount=2
-        mouse_up = CGEventCreateMouseEvent(
-            event_source,  # source
-            0x02,          # kCGEventLeftMouseUp
-            (x, y),        # location
-            0              # kCGMouseButtonLeft (0 = left button)
-        )
-        CGEventSetIntegerValueField(mouse_up, 0x0A, 2)  # kCGMouseEventClickState = 2
+        err = AXUIElementSetAttributeValue(element, kAXValueAttribute, text)
+        if err != 0:
+            logger.error("Failed to set text value: error code %s", err)
+            return False
+        
+        if verify:
+            _pause(_POST_SET_DELAY)
+            if get_value(element) is None:
+                logger.warning("Value set but readback returned None")
+        
+        if submit:
+            _pause(_POST_SET_DELAY)
+            key_down, key_up = _key_events(KEY_CODES["return"], 0, None)
+            CGEventPost(0, key_down)
+            _pause(_INTER_EVENT_DELAY)
+            CGEventPost(0, key_up)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Successfully filled field: %.20s%s", text, "..." if len(text) > 20 else "")
+        return True
+        
+    except Exception as e:
+        logger.error("Error filling field: %s", e)
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _double_click_events() -> tuple[Any, Any]:
+    """Build the double-click mouse down/up events once (moved per click)."""
+    # Create left mouse down event with clickCount=2
+    mouse_down = CGEventCreateMouseEvent(
+        _EVENT_SOURCE,  # source
+        0x01,          # kCGEventLeftMouseDown
+        (0, 0),        # location (set on each click)
+        0              # kCGMouseButtonLeft (0 = left button)
+    )
+    CGEventSetIntegerValueField(mouse_down, 0x0A, 2)  # kCGMouseEventClickState = 2 for double-click
+    
+    # Create left mouse up event with clickCount=2
+    mouse_up = CGEventCreateMouseEvent(
+        _EVENT_SOURCE,  # source
+        0x02,          # kCGEventLeftMouseUp
+        (0, 0),        # location (set on each click)
+        0              # kCGMouseButtonLeft (0 = left button)
+    )
+    CGEventSetIntegerValueField(mouse_up, 0x0A, 2)  # kCGMouseEventClickState = 2
+    return mouse_down, mouse_up
+
+
+def perform_double_click_at(x: float, y: float) -> bool:
+    """
+    Double-click at screen coordinates.
+    
+    Fast path for callers that already know where to click: no AX
+    lookups, and the cached mouse events are just moved and re-posted.
+    
+    Args:
+        x: Horizontal screen coordinate.
+        y: Vertical screen coordinate.
+    
+    Returns:
+        True if the events were posted, False otherwise.
+    """
+    try:
+        clear_ax_cache()
+        
+        mouse_down, mouse_up = _double_click_events()
+        CGEventSetLocation(mouse_down, (x, y))
+        CGEventSetLocation(mouse_up, (x, y))
         
         # Post the events
         CGEventPost(0, mouse_down)
-        time.sleep(0.02)
+        _pause(_INTER_EVENT_DELAY)
         CGEventPost(0, mouse_up)
         
-        logger.info("Successfully double-clicked element")
+        logger.info("Successfully double-clicked at (%s, %s)", x, y)
         return True
         
     except Exception as e:
-        logger.error(f"Error performing double-click: {e}")
-        # Fallback to two rapid clicks
-        return perform_click(element) and perform_click(element)
+        logger.error("Error performing double-click: %s", e)
+        return False
+
+
+def perform_double_click(element: AXUIElement) -> bool:
+    """
+    Perform a double-click action on an element.
+    
+    Simulates a double-click using CGEvent with clickCount=2 at the
+    element's center. Useful for opening files, folders, or items
+    that require double-click to activate.
+    
+    Args:
+        element: The AXUIElement to double-click.
+    
+    Returns:
+        True if successful, False otherwise.
+    """
+    if element is None:
+        logger.warning("Cannot double-click None element")
+        return False
+    
+    # Get the element's center (AXPosition + AXSize in one call)
+    center = _element_center(element)
+    if center is None:
+        logger.error("Could not get element position")
+        return perform_click(element)  # Fallback to single click
+    
+    return perform_double_click_at(*center)
+
+
+@functools.lru_cache(maxsize=1)
+def _select_all_events() -> tuple[Any, Any]:
+    """Build the Cmd+A key down/up event templates once."""
+    # 'a' key = 0x00
+    key_down = CGEventCreateKeyboardEvent(_EVENT_SOURCE, 0x00, True)
+    key_up = CGEventCreateKeyboardEvent(_EVENT_SOURCE, 0x00, False)
+    
+    # Set command modifier using CGEventSetFlags (0x100000 = kCGEventFlagMaskCommand)
+    CGEventSetFlags(key_down, 0x100000)
+    return key_down, key_up
 
 
 def perform_select_all(element: AXUIElement) -> bool:
@@ -538,34 +986,96 @@ def perform_select_all(element: AXUIElement) -> bool:
         True if successful, False otherwise.
     """
     try:
-        # Focus the element
-        if not perform_focus(element):
-            logger.warning("Could not focus element for select all")
+        clear_ax_cache()
         
-        time.sleep(0.05)
-        
-        # Create Cmd+A key combination
-        event_source = None
-        
-        # 'a' key = 0x00
-        key_down = CGEventCreateKeyboardEvent(event_source, 0x00, True)
-        key_up = CGEventCreateKeyboardEvent(event_source, 0x00, False)
+        # Focus the element (reading AXFocused back instead of sleeping)
+        if not perform_focus(element, verify=True):
+            logger.warning("Could not focus element for select all")
+        _pause(_POST_SET_DELAY)
         
-        # Set command modifier using CGEventSetFlags (0x100000 = kCGEventFlagMaskCommand)
-        CGEventSetFlags(key_down, 0x100000)
+        # Re-post the prebuilt Cmd+A events
+        key_down, key_up = _select_all_events()
         
         CGEventPost(0, key_down)
-        time.sleep(0.01)
+        _pause(_INTER_EVENT_DELAY)
         CGEventPost(0, key_up)
         
         logger.info("Successfully selected all text")
         return True
         
     except Exception as e:
-        logger.error(f"Error selecting all: {e}")
+        logger.error("Error selecting all: %s", e)
         return False
 
 
+# Bulk action handlers: (element, action dict, needs_focus) -> success
+_BULK_HANDLERS = {
+    "click": lambda element, spec, focus: perform_click(element),
+    # Only an element already focused by this bulk run skips the write; None fails
+    "focus": lambda element, spec, focus: True if element is not None and not focus else perform_focus(element),
+    "type": lambda element, spec, focus: perform_type(element, spec.get("text"), focus=focus),
+    "press_key": lambda element, spec, focus: perform_press_key(element, spec.get("key", ""), focus=focus),
+    "press_keys": lambda element, spec, focus: perform_press_keys(element, spec.get("keys", []), focus=focus),
+    "fill": lambda element, spec, focus: fill_field(element, spec.get("text"), submit=spec.get("submit", False)),
+}
+
+
+# Bulk actions after which the previously focused element can't be assumed
+_FOCUS_MOVING_ACTIONS = frozenset(("click", "press_key", "press_keys"))
+
+
+def perform_bulk(actions: list[dict[str, Any]]) -> list[bool]:
+    """
+    Perform a sequence of actions in a single call.
+    
+    Each action is a dict with an "action" key ("click", "focus", "type",
+    "press_key", "press_keys" or "fill"), an "element", and
+    "text"/"key"/"keys"/"submit" where needed. Focus is only set when it
+    moves to a different element, so focusing a field and then typing into
+    it doesn't re-focus the same field. Clicks, key presses and submitted
+    fills can move focus anywhere, so the next action re-focuses.
+    
+    Args:
+        actions: List of action dicts, performed in order.
+    
+    Returns:
+        List of booleans, one per action, True where the action succeeded.
+    
+    Example:
+        >>> results = perform_bulk([
+        ...     {"action": "type", "element": name_field, "text": "Jane"},
+        ...     {"action": "type", "element": email_field, "text": "jane@example.com"},
+        ...     {"action": "press_key", "element": email_field, "key": "return"},
+        ... ])
+        >>> all(results)
+        True
+    """
+    results = []
+    last_focused = None
+    
+    for spec in actions:
+        action = spec.get("action")
+        handler = _BULK_HANDLERS.get(action)
+        if handler is None:
+            logger.error("Unknown bulk action: %s", action)
+            results.append(False)
+            continue
+        
+        element = spec.get("element")
+        needs_focus = element is not None and (last_focused is None or element != last_focused)
+        success = handler(element, spec, needs_focus)
+        results.append(success)
+        
+        # Track which element holds focus; clicks and key events can move it anywhere
+        if action in _FOCUS_MOVING_ACTIONS or (action == "fill" and spec.get("submit")) or not success:
+            last_focused = None
+        elif needs_focus:
+            last_focused = element
+    
+    logger.info("Performed %s/%s bulk actions", sum(results), len(results))
+    return results
+
+
 # ============================================================================
 # Module self-test (run when executed directly)
 # ============================================================================
@@ -9,8 +9,16 @@ Functions:
     - get_app_by_name(app_name): Find running app by name, return AXUIElement
     - get_app_element(pid): Get AXUIElement for process ID
     - get_attribute(element, attr_name): Read AX attribute value
+    - invalidate_element(element) / clear_attr_cache(): Drop cached attribute reads
+    - get_attributes(element, attr_names): Read several AX attributes in one call
     - get_attribute_names(element): List all available attributes
+    - has_attribute(element, attr_name): Check whether an attribute is supported
+    - iter_children(element) / iter_windows(element): Iterate child/window elements
     - serialize_element(element): Convert AXUIElement to dict
+    - serialize_elements(elements): Convert many AXUIElements to dicts
+    - serialize_element_data(element): Convert AXUIElement to a slotted AXElementData
+    - learn_schema(element): Limit serialization to the attributes an app populates
+    - watch_element(element, notifications, callback): Push-based change notifications
 
 Requirements:
     - Python 3.9+
@@ -22,16 +30,47 @@ License: MIT
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any, Optional
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 # PyObjC imports for macOS Accessibility APIs
-from Cocoa import NSWorkspace, NSRunningApplication, NSValue
-from CoreFoundation import CGPoint, CGSize
+from Cocoa import (
+    NSWorkspace,
+    NSRunningApplication,
+    NSValue,
+    NSWorkspaceApplicationKey,
+    NSWorkspaceDidLaunchApplicationNotification,
+    NSWorkspaceDidTerminateApplicationNotification,
+)
+from CoreFoundation import (
+    CGPoint,
+    CGSize,
+    CFEqual,
+    CFGetTypeID,
+    CFHash,
+    CFRunLoopAddSource,
+    CFRunLoopGetCurrent,
+    CFRunLoopRemoveSource,
+    CFRunLoopRunInMode,
+    kCFRunLoopDefaultMode,
+)
 from ApplicationServices import (
+    AXObserverAddNotification,
+    AXObserverCreate,
+    AXObserverGetRunLoopSource,
     AXUIElementCreateApplication,
     AXUIElementCopyAttributeValue,
     AXUIElementCopyAttributeNames,
+    AXUIElementCopyMultipleAttributeValues,
+    AXUIElementGetPid,
+    AXValueGetType,
+    AXValueGetTypeID,
     AXValueGetValue,
 )
 
@@ -40,11 +79,16 @@ try:
     from ApplicationServices import (
         kAXValueTypeCGPoint,
         kAXValueTypeCGSize,
+        kAXValueTypeAXError,
     )
 except ImportError:
     # Fallback values (these are the enum values)
     kAXValueTypeCGPoint = 1  # kAXValueCGPointType
     kAXValueTypeCGSize = 2   # kAXValueCGSizeType
+    kAXValueTypeAXError = 5  # kAXValueAXErrorType
+
+# CFTypeID of AXValueRef, checked before AXValueGetType is called on a value
+_AX_VALUE_TYPE_ID = AXValueGetTypeID()
 
 # Configure logging
 logging.basicConfig(
@@ -57,6 +101,27 @@ logger = logging.getLogger(__name__)
 AXUIElement = Any  # AXUIElementRef is an opaque type
 AXErrorCode = int
 
+# App name -> PID of the matched app, persisted so later CLI calls skip enumeration
+APP_PID_CACHE_FILE = os.path.expanduser("~/.axctl_ax_pid_cache")
+
+# Lower-cased app name -> (checked_at, pid, AXUIElement) resolved in this process
+_APP_ELEMENT_CACHE: dict[str, tuple[float, int, AXUIElement]] = {}
+
+# PID -> (checked_at, AXUIElement) created by get_app_element
+_PID_ELEMENT_CACHE: dict[int, tuple[float, AXUIElement]] = {}
+_PID_ELEMENT_CACHE_MAX = 64
+
+# Live AXObservers created by watch_element (kept referenced until stopped)
+_OBSERVERS: list[Any] = []
+
+# watch_element callbacks that fired while the running-apps index was pumping
+# the run loop; replayed by the next drain_events() instead of reentrantly
+_DEFERRED_WATCH_CALLBACKS: list[tuple[Callable[[Any, str], None], Any, str]] = []
+_defer_watch_callbacks = False
+
+# Seconds a cached app element is trusted before its PID is re-checked
+_APP_CACHE_TTL = 5.0
+
 
 # Try to import AX constants, fallback to strings if unavailable
 try:
@@ -78,36 +143,276 @@ try:
         kAXSelectedAttribute,
         kAXSelectedTextAttribute,
         kAXVisibleAttribute,
+        kAXHiddenAttribute,
         kAXMinValueAttribute,
         kAXMaxValueAttribute,
         kAXIncrementAttribute,
         kAXPlaceholderValueAttribute,
+        kAXValueChangedNotification,
     )
     _AX_CONSTANTS_AVAILABLE = True
 except ImportError:
     _AX_CONSTANTS_AVAILABLE = False
-    # Fallback string constants
-    kAXRoleAttribute = "AXRole"
-    kAXTitleAttribute = "AXTitle"
-    kAXDescriptionAttribute = "AXDescription"
-    kAXValueAttribute = "AXValue"
-    kAXEnabledAttribute = "AXEnabled"
-    kAXFocusedAttribute = "AXFocused"
-    kAXPositionAttribute = "AXPosition"
-    kAXSizeAttribute = "AXSize"
-    kAXWindowsAttribute = "AXWindows"
-    kAXChildrenAttribute = "AXChildren"
-    kAXParentAttribute = "AXParent"
-    kAXSubroleAttribute = "AXSubrole"
-    kAXIdentifierAttribute = "AXIdentifier"
-    kAXHelpAttribute = "AXHelp"
-    kAXSelectedAttribute = "AXSelected"
-    kAXSelectedTextAttribute = "AXSelectedText"
-    kAXVisibleAttribute = "AXVisible"
-    kAXMinValueAttribute = "AXMinValue"
-    kAXMaxValueAttribute = "AXMaxValue"
-    kAXIncrementAttribute = "AXIncrement"
-    kAXPlaceholderValueAttribute = "AXPlaceholderValue"
+    # Fallback string constants (interned, so dict lookups hit on identity)
+    kAXRoleAttribute = sys.intern("AXRole")
+    kAXTitleAttribute = sys.intern("AXTitle")
+    kAXDescriptionAttribute = sys.intern("AXDescription")
+    kAXValueAttribute = sys.intern("AXValue")
+    kAXEnabledAttribute = sys.intern("AXEnabled")
+    kAXFocusedAttribute = sys.intern("AXFocused")
+    kAXPositionAttribute = sys.intern("AXPosition")
+    kAXSizeAttribute = sys.intern("AXSize")
+    kAXWindowsAttribute = sys.intern("AXWindows")
+    kAXChildrenAttribute = sys.intern("AXChildren")
+    kAXParentAttribute = sys.intern("AXParent")
+    kAXSubroleAttribute = sys.intern("AXSubrole")
+    kAXIdentifierAttribute = sys.intern("AXIdentifier")
+    kAXHelpAttribute = sys.intern("AXHelp")
+    kAXSelectedAttribute = sys.intern("AXSelected")
+    kAXSelectedTextAttribute = sys.intern("AXSelectedText")
+    kAXVisibleAttribute = sys.intern("AXVisible")
+    kAXHiddenAttribute = sys.intern("AXHidden")
+    kAXMinValueAttribute = sys.intern("AXMinValue")
+    kAXMaxValueAttribute = sys.intern("AXMaxValue")
+    kAXIncrementAttribute = sys.intern("AXIncrement")
+    kAXPlaceholderValueAttribute = sys.intern("AXPlaceholderValue")
+    kAXValueChangedNotification = sys.intern("AXValueChanged")
+
+# Attribute name strings -> AX API constants
+_ATTR_MAP = {
+    "AXRole": kAXRoleAttribute,
+    "AXTitle": kAXTitleAttribute,
+    "AXDescription": kAXDescriptionAttribute,
+    "AXValue": kAXValueAttribute,
+    "AXEnabled": kAXEnabledAttribute,
+    "AXFocused": kAXFocusedAttribute,
+    "AXPosition": kAXPositionAttribute,
+    "AXSize": kAXSizeAttribute,
+    "AXWindows": kAXWindowsAttribute,
+    "AXChildren": kAXChildrenAttribute,
+    "AXParent": kAXParentAttribute,
+    "AXSubrole": kAXSubroleAttribute,
+    "AXIdentifier": kAXIdentifierAttribute,
+    "AXHelp": kAXHelpAttribute,
+    "AXSelected": kAXSelectedAttribute,
+    "AXSelectedText": kAXSelectedTextAttribute,
+    "AXVisible": kAXVisibleAttribute,
+    "AXHidden": kAXHiddenAttribute,
+}
+
+# Attributes that don't change for the lifetime of an element, so reads
+# of them are memoized: (_AXKey(element), attribute) -> value
+_IMMUTABLE_ATTRS = frozenset({
+    kAXRoleAttribute,
+    kAXSubroleAttribute,
+    kAXIdentifierAttribute,
+    kAXHelpAttribute,
+    kAXPlaceholderValueAttribute,
+})
+_ATTR_CACHE_MAX = 4096
+_ATTR_CACHE: dict[tuple[_AXKey, str], Any] = {}
+
+
+class _AXKey:
+    """
+    Dict/set key for an AXUIElement by CF identity rather than wrapper identity.
+    
+    PyObjC can hand out distinct Python wrappers for the same AXUIElementRef,
+    so id() misses repeats; CFHash/CFEqual compare the underlying element.
+    """
+    
+    __slots__ = ("ref", "_hash")
+    
+    def __init__(self, ref: AXUIElement):
+        self.ref = ref
+        self._hash = CFHash(ref)
+    
+    def __hash__(self) -> int:
+        return self._hash
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _AXKey) and (
+            self.ref is other.ref or bool(CFEqual(self.ref, other.ref))
+        )
+
+
+class _RunningAppsIndex:
+    """
+    Running applications kept up to date by NSWorkspace launch/terminate
+    notifications, so lookups don't re-enumerate every process.
+    
+    Seeded from runningApplications() on first use. Notifications are
+    delivered when the run loop is pumped, which find() and snapshot() do
+    (see _pump_app_notifications()). Delivery isn't guaranteed (nothing may
+    be servicing the notification port), so the index is re-seeded once it
+    is older than _RESEED_INTERVAL. If the observers can't be registered,
+    every call falls back to a fresh enumeration.
+    """
+    
+    # Seconds an observed index is trusted before it is re-enumerated
+    _RESEED_INTERVAL = 30.0
+    
+    def __init__(self) -> None:
+        # PID -> (localized name, NSRunningApplication), in launch order
+        self._apps: dict[int, tuple[str, Any]] = {}
+        # Lower-cased name -> PID of the first app with that name
+        self._by_name: dict[str, int] = {}
+        self._live = False
+        self._started = False
+        self._seeded_at = 0.0
+    
+    def _add(self, ns_app: Any) -> None:
+        name = ns_app.localizedName()
+        if name is None:
+            return
+        pid = ns_app.processIdentifier()
+        self._apps[pid] = (str(name), ns_app)
+        self._by_name.setdefault(str(name).lower(), pid)
+    
+    def _remove(self, ns_app: Any) -> None:
+        pid = ns_app.processIdentifier()
+        entry = self._apps.pop(pid, None)
+        if entry is None:
+            return
+        key = entry[0].lower()
+        if self._by_name.get(key) == pid:
+            del self._by_name[key]
+            # Another app with the same name may still be running
+            for other_pid, (name, _) in self._apps.items():
+                if name.lower() == key:
+                    self._by_name[key] = other_pid
+                    break
+    
+    def _on_launch(self, notification: Any) -> None:
+        ns_app = notification.userInfo().get(NSWorkspaceApplicationKey)
+        if ns_app is not None:
+            self._add(ns_app)
+    
+    def _on_terminate(self, notification: Any) -> None:
+        ns_app = notification.userInfo().get(NSWorkspaceApplicationKey)
+        if ns_app is not None:
+            self._remove(ns_app)
+    
+    def _seed(self) -> None:
+        self._apps.clear()
+        self._by_name.clear()
+        for ns_app in NSWorkspace.sharedWorkspace().runningApplications():
+            self._add(ns_app)
+        self._seeded_at = time.monotonic()
+    
+    def _ensure_started(self) -> None:
+        if self._started:
+            if self._live and time.monotonic() - self._seeded_at < self._RESEED_INTERVAL:
+                _pump_app_notifications()
+            else:
+                self._seed()
+            return
+        
+        self._started = True
+        try:
+            center = NSWorkspace.sharedWorkspace().notificationCenter()
+            center.addObserverForName_object_queue_usingBlock_(
+                NSWorkspaceDidLaunchApplicationNotification, None, None, self._on_launch)
+            center.addObserverForName_object_queue_usingBlock_(
+                NSWorkspaceDidTerminateApplicationNotification, None, None, self._on_terminate)
+            self._live = True
+        except Exception as e:
+            logger.debug("Could not observe app launches, enumerating instead: %s", e)
+        self._seed()
+    
+    def find(self, app_name: str) -> Optional[Any]:
+        """
+        Return the NSRunningApplication matching app_name (exact
+        case-insensitive match first, then the first partial match).
+        """
+        self._ensure_started()
+        wanted = app_name.lower()
+        
+        pid = self._by_name.get(wanted)
+        if pid is not None:
+            ns_app = self._apps[pid][1]
+            logger.info(f"Found app '{app_name}' with PID {pid}")
+            return ns_app
+        
+        # Try partial match if exact match fails
+        for pid, (name, ns_app) in self._apps.items():
+            if wanted in name.lower():
+                logger.info(f"Found partial match '{name}' with PID {pid}")
+                return ns_app
+        
+        return None
+    
+    def snapshot(self) -> list[tuple[str, int, Any]]:
+        """Return (name, pid, NSRunningApplication) for every named running app."""
+        self._ensure_started()
+        return [(name, pid, ns_app) for pid, (name, ns_app) in self._apps.items()]
+
+
+_RUNNING_APPS = _RunningAppsIndex()
+
+
+def _find_running_app(app_name: str) -> Optional[Any]:
+    """
+    Return the NSRunningApplication matching app_name (exact
+    case-insensitive match first, then partial).
+    """
+    return _RUNNING_APPS.find(app_name)
+
+
+def _read_pid_cache() -> dict[str, Any]:
+    """Read the on-disk app PID cache, returning an empty dict if missing or corrupt."""
+    try:
+        with open(APP_PID_CACHE_FILE, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _cached_app_pid(key: str) -> Optional[int]:
+    """
+    Return the cached PID for an app name if that process is still the same app.
+    
+    The PID is checked with NSRunningApplication (a single lookup) so a quit
+    app, or a PID reused by another process, is never handed out.
+    """
+    entry = _read_pid_cache().get(key)
+    if not isinstance(entry, dict):
+        return None
+    
+    pid = entry.get("pid")
+    if not isinstance(pid, int):
+        return None
+    
+    ns_app = NSRunningApplication.runningApplicationWithProcessIdentifier_(pid)
+    if ns_app is None or ns_app.isTerminated() or ns_app.localizedName() != entry.get("name"):
+        return None
+    
+    logger.debug(f"Using cached PID {pid} for '{key}'")
+    return pid
+
+
+def _store_app_pid(key: str, pid: int, name: str) -> None:
+    """Persist the PID an app name resolved to (best effort)."""
+    data = _read_pid_cache()
+    data[key] = {"pid": pid, "name": name}
+    cache_dir = os.path.dirname(APP_PID_CACHE_FILE) or "."
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".axctl_ax_pid_")
+    except OSError as e:
+        logger.debug(f"Could not write PID cache: {e}")
+        return
+    try:
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, APP_PID_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write PID cache: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 
 def get_app_by_name(app_name: str) -> Optional[AXUIElement]:
@@ -115,7 +420,11 @@ def get_app_by_name(app_name: str) -> Optional[AXUIElement]:
     Find a running application by name and return its AXUIElement.
     
     Searches through running applications using NSWorkspace to find
-    an app matching the given name (case-insensitive match).
+    an app matching the given name (case-insensitive match). Results are
+    reused within the process (re-checking the PID is still alive every
+    _APP_CACHE_TTL seconds), and the matched PID is cached in
+    APP_PID_CACHE_FILE so later calls can skip the enumeration. Only
+    exact-name matches are cached, so partial matches are re-resolved.
     
     Args:
         app_name: The name of the application (e.g., "Safari", "Finder").
@@ -129,36 +438,46 @@ def get_app_by_name(app_name: str) -> Optional[AXUIElement]:
         >>> if app_element:
         ...     print("Found Safari!")
     """
-    try:
-        # Get all running applications from NSWorkspace
-        workspace = NSWorkspace.sharedWorkspace()
-        running_apps = workspace.runningApplications()
+    key = app_name.lower()
+    now = time.monotonic()
+    cached = _APP_ELEMENT_CACHE.get(key)
+    if cached is not None:
+        checked_at, pid, app_element = cached
+        if now - checked_at < _APP_CACHE_TTL:
+            return app_element
         
-        # Search for the requested application
-        for ns_app in running_apps:
-            # Get the app name (localizedName handles localization)
-            app_name_str = ns_app.localizedName()
+        # Cheap liveness check by PID, no enumeration
+        ns_app = NSRunningApplication.runningApplicationWithProcessIdentifier_(pid)
+        if ns_app is not None and not ns_app.isTerminated():
+            _APP_ELEMENT_CACHE[key] = (now, pid, app_element)
+            return app_element
+        del _APP_ELEMENT_CACHE[key]
+    
+    try:
+        pid = _cached_app_pid(key)
+        if pid is None:
+            ns_app = _find_running_app(app_name)
+            if ns_app is None:
+                logger.warning(f"Application '{app_name}' not found")
+                return None
             
-            if app_name_str is None:
-                continue
-                
-            # Case-insensitive comparison
-            if app_name_str.lower() == app_name.lower():
-                pid = ns_app.processIdentifier()
-                logger.info(f"Found app '{app_name}' with PID {pid}")
-                return get_app_element(pid)
-        
-        # Try partial match if exact match fails
-        for ns_app in running_apps:
-            app_name_str = ns_app.localizedName()
-            if app_name_str and app_name.lower() in app_name_str.lower():
-                pid = ns_app.processIdentifier()
-                logger.info(f"Found partial match '{app_name_str}' with PID {pid}")
-                return get_app_element(pid)
-        
-        logger.warning(f"Application '{app_name}' not found")
-        return None
+            pid = ns_app.processIdentifier()
+            name = ns_app.localizedName()
+            exact = bool(name) and name.lower() == key
+            
+            # Only exact matches are remembered: a partial match (e.g.
+            # "safari" -> "Safari Technology Preview") must give way to the
+            # exact-name app as soon as that launches
+            if exact:
+                _store_app_pid(key, pid, name)
+        else:
+            exact = True
         
+        app_element = get_app_element(pid)
+        if app_element is not None and exact:
+            _APP_ELEMENT_CACHE[key] = (now, pid, app_element)
+        return app_element
+    
     except Exception as e:
         logger.error(f"Error finding app '{app_name}': {e}")
         return None
@@ -169,7 +488,8 @@ def get_app_element(pid: int) -> Optional[AXUIElement]:
     Get the AXUIElement for a process ID.
     
     Creates an AXUIElement reference for the application associated
-    with the given process ID.
+    with the given process ID. The element is reused for later calls
+    with the same PID while that process is still running.
     
     Args:
         pid: The process ID of the application.
@@ -183,6 +503,20 @@ def get_app_element(pid: int) -> Optional[AXUIElement]:
         ...     print(f"Got AX element for PID {pid}")
     """
     try:
+        now = time.monotonic()
+        cached = _PID_ELEMENT_CACHE.get(pid)
+        if cached is not None:
+            checked_at, app_element = cached
+            if now - checked_at < _APP_CACHE_TTL:
+                return app_element
+            
+            # Drop the entry if the process has quit (its PID may be reused)
+            ns_app = NSRunningApplication.runningApplicationWithProcessIdentifier_(pid)
+            if ns_app is not None and not ns_app.isTerminated():
+                _PID_ELEMENT_CACHE[pid] = (now, app_element)
+                return app_element
+            del _PID_ELEMENT_CACHE[pid]
+        
         # Create AXUIElement for the application
         app_element = AXUIElementCreateApplication(pid)
         
@@ -190,9 +524,14 @@ def get_app_element(pid: int) -> Optional[AXUIElement]:
             logger.error(f"Failed to create AXUIElement for PID {pid}")
             return None
         
+        # Evict the oldest entry when full
+        if len(_PID_ELEMENT_CACHE) >= _PID_ELEMENT_CACHE_MAX:
+            del _PID_ELEMENT_CACHE[next(iter(_PID_ELEMENT_CACHE))]
+        _PID_ELEMENT_CACHE[pid] = (now, app_element)
+        
         logger.debug(f"Created AXUIElement for PID {pid}")
         return app_element
-        
+    
     except Exception as e:
         logger.error(f"Error getting app element for PID {pid}: {e}")
         return None
@@ -203,7 +542,9 @@ def get_attribute(element: AXUIElement, attr_name: str) -> Optional[Any]:
     Read an AX attribute from an element.
     
     Retrieves the value of a specific accessibility attribute
-    from an AXUIElement.
+    from an AXUIElement. Attributes in _IMMUTABLE_ATTRS (role,
+    subrole, identifier, ...) are cached per element after the
+    first successful read.
     
     Args:
         element: The AXUIElement to query.
@@ -213,6 +554,8 @@ def get_attribute(element: AXUIElement, attr_name: str) -> Optional[Any]:
     
     Returns:
         The attribute value, or None if not found or on error.
+        Errors raised by the PyObjC binding itself (e.g. a non-element
+        argument) propagate to the caller.
     
     Example:
         >>> role = get_attribute(element, "AXRole")
@@ -220,34 +563,53 @@ def get_attribute(element: AXUIElement, attr_name: str) -> Optional[Any]:
         >>> print(f"Role: {role}, Title: {title}")
     """
     if element is None:
-        logger.warning("Cannot get attribute from None element")
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Cannot get attribute from None element")
         return None
     
-    try:
-        # Convert string attribute name to AX API constant if needed
-        attr = _resolve_attribute_name(attr_name)
-        
-        # Copy the attribute value - returns (err, value) tuple
-        err, value = AXUIElementCopyAttributeValue(element, attr, None)
-        if err != 0:
-            logger.debug(f"Error getting attribute '{attr_name}': error code {err}")
-            return None
-        
-        # AXErrorNoValue means the attribute exists but has no value
-        # AXErrorAttributeUnsupported means the attribute doesn't exist
-        if value is None:
-            # Check if it's actually an error vs just empty
-            # The API returns (value, error) tuple in some contexts
-            logger.debug(f"Attribute '{attr_name}' returned None")
-            return None
-            
-        logger.debug(f"Got attribute '{attr_name}': {value}")
-        return value
-        
-    except Exception as e:
-        # AXUIElementCopyAttributeValue raises AXError on failure
-        logger.debug(f"Error getting attribute '{attr_name}': {e}")
+    # Convert string attribute name to AX API constant if needed
+    attr = _ATTR_MAP.get(attr_name, attr_name)
+    
+    cacheable = attr in _IMMUTABLE_ATTRS
+    if cacheable:
+        cache_key = (_AXKey(element), attr)
+        cached = _ATTR_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+    
+    # Copy the attribute value - returns (err, value) tuple; AX failures
+    # are reported through err, so there is nothing to catch here
+    err, value = AXUIElementCopyAttributeValue(element, attr, None)
+    if err != 0:
+        logger.debug("Error getting attribute '%s': error code %s", attr_name, err)
+        return None
+    
+    # AXErrorNoValue means the attribute exists but has no value
+    # AXErrorAttributeUnsupported means the attribute doesn't exist
+    if value is None:
+        logger.debug("Attribute '%s' returned None", attr_name)
         return None
+    
+    if cacheable:
+        # Evict the oldest entry when full
+        if len(_ATTR_CACHE) >= _ATTR_CACHE_MAX:
+            del _ATTR_CACHE[next(iter(_ATTR_CACHE))]
+        _ATTR_CACHE[cache_key] = value
+    
+    logger.debug("Got attribute '%s': %s", attr_name, value)
+    return value
+
+
+def invalidate_element(element: AXUIElement) -> None:
+    """Drop cached attribute reads for one element (e.g. after it was rebuilt)."""
+    element_key = _AXKey(element)
+    for key in [k for k in _ATTR_CACHE if k[0] == element_key]:
+        del _ATTR_CACHE[key]
+
+
+def clear_attr_cache() -> None:
+    """Drop all cached attribute reads."""
+    _ATTR_CACHE.clear()
 
 
 def get_attribute_names(element: AXUIElement) -> Optional[list[str]]:
@@ -269,14 +631,15 @@ def get_attribute_names(element: AXUIElement) -> Optional[list[str]]:
         ...     print(f"Available attributes: {attrs}")
     """
     if element is None:
-        logger.warning("Cannot get attribute names from None element")
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Cannot get attribute names from None element")
         return None
     
     try:
         # Get all attribute names - returns (err, attr_names) tuple
         err, attr_names = AXUIElementCopyAttributeNames(element, None)
         if err != 0:
-            logger.error(f"Error getting attribute names: error code {err}")
+            logger.error("Error getting attribute names: error code %s", err)
             return None
         
         if attr_names is None:
@@ -289,23 +652,240 @@ def get_attribute_names(element: AXUIElement) -> Optional[list[str]]:
         else:
             result = [attr_names]
         
-        logger.debug(f"Found {len(result)} attributes")
+        logger.debug("Found %s attributes", len(result))
         return result
-        
+    
     except Exception as e:
         logger.error(f"Error getting attribute names: {e}")
         return None
 
 
-def serialize_element(element: AXUIElement) -> Optional[dict[str, Any]]:
+def has_attribute(element: AXUIElement, attr_name: str) -> bool:
+    """
+    Check whether an element supports an attribute.
+    
+    Tests membership on the NSArray returned by AXUIElementCopyAttributeNames
+    (containsObject_), without bridging every name into a Python list.
+    
+    Args:
+        element: The AXUIElement to query.
+        attr_name: The attribute name (e.g. kAXChildrenAttribute or "AXSelected").
+    
+    Returns:
+        True if the element lists the attribute, False otherwise or on error.
+    
+    Example:
+        >>> if has_attribute(element, kAXChildrenAttribute):
+        ...     children = get_children(element)
+    """
+    if element is None:
+        return False
+    
+    try:
+        err, attr_names = AXUIElementCopyAttributeNames(element, None)
+        if err != 0 or attr_names is None:
+            return False
+        return bool(attr_names.containsObject_(_ATTR_MAP.get(attr_name, attr_name)))
+    
+    except Exception as e:
+        logger.debug("Error checking attribute %s: %s", attr_name, e)
+        return False
+
+
+def _is_ax_error(value: Any) -> bool:
+    """Check if a multi-attribute result slot is an AXError placeholder."""
+    if value is None or isinstance(value, (str, int, float)):
+        return False
+    try:
+        # AXValueGetType is only defined for AXValueRefs; elements, arrays
+        # and other CF types in the result must not reach it
+        return (CFGetTypeID(value) == _AX_VALUE_TYPE_ID
+                and AXValueGetType(value) == kAXValueTypeAXError)
+    except Exception:
+        return False
+
+
+def get_attributes(element: AXUIElement, attr_names: tuple[str, ...]) -> list[Optional[Any]]:
+    """
+    Read several AX attributes from an element in one call.
+    
+    Uses AXUIElementCopyMultipleAttributeValues, so N attributes cost one
+    round-trip to the accessibility server instead of N.
+    
+    Args:
+        element: The AXUIElement to query.
+        attr_names: Attribute names to read, in order.
+    
+    Returns:
+        List of values in the same order as attr_names, with None for
+        attributes the element doesn't provide (all None on error).
+    
+    Example:
+        >>> role, title = get_attributes(element, (kAXRoleAttribute, kAXTitleAttribute))
+    """
+    if element is None:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Cannot get attributes from None element")
+        return [None] * len(attr_names)
+    
+    try:
+        err, values = AXUIElementCopyMultipleAttributeValues(element, attr_names, 0, None)
+        if err != 0 or values is None:
+            logger.debug(f"Error getting attributes {attr_names}: error code {err}")
+            return [None] * len(attr_names)
+        
+        # Missing attributes come back as AXError values in their slot
+        return [None if _is_ax_error(value) else value for value in values]
+    
+    except Exception as e:
+        logger.debug(f"Error getting attributes {attr_names}: {e}")
+        return [None] * len(attr_names)
+
+
+def _as_str(value: Any) -> Optional[str]:
+    """Coerce an attribute to str (None if empty), skipping str() on plain strings."""
+    if not value:
+        return None
+    return value if type(value) is str else str(value)
+
+
+def _as_bool(value: Any) -> Optional[bool]:
+    """Coerce an attribute to bool (None if missing), skipping bool() on bools."""
+    if value is None or type(value) is bool:
+        return value
+    return bool(value)
+
+
+def _as_json_value(value: Any) -> Any:
+    """Preserve native JSON types (bool, int, float, str, None), stringify the rest."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _as_point(value: Any) -> Optional[dict[str, float]]:
+    """Unwrap an AXPosition AXValueRef (a CGPoint) into {"x", "y"}."""
+    if value is None:
+        return None
+    # AXValueGetValue returns (success_bool, output_struct) - struct has .x/.y attributes
+    success, point = AXValueGetValue(value, kAXValueTypeCGPoint, None)
+    if success:
+        return {"x": point.x, "y": point.y}
+    logger.debug("Could not unwrap position: %s", value)
+    return None
+
+
+def _as_size(value: Any) -> Optional[dict[str, float]]:
+    """Unwrap an AXSize AXValueRef (a CGSize) into {"width", "height"}."""
+    if value is None:
+        return None
+    success, sz = AXValueGetValue(value, kAXValueTypeCGSize, None)
+    if success:
+        return {"width": sz.width, "height": sz.height}
+    logger.debug("Could not unwrap size: %s", value)
+    return None
+
+
+# (result key, attribute, coercion) for each field serialize_element emits
+_SERIALIZE_SPEC = (
+    ("role", kAXRoleAttribute, _as_str),
+    ("subrole", kAXSubroleAttribute, _as_str),
+    ("title", kAXTitleAttribute, _as_str),
+    ("description", kAXDescriptionAttribute, _as_str),
+    ("value", kAXValueAttribute, _as_json_value),
+    ("enabled", kAXEnabledAttribute, _as_bool),
+    ("focused", kAXFocusedAttribute, _as_bool),
+    ("position", kAXPositionAttribute, _as_point),
+    ("size", kAXSizeAttribute, _as_size),
+    ("identifier", kAXIdentifierAttribute, _as_str),
+    ("help", kAXHelpAttribute, _as_str),
+    ("selected", kAXSelectedAttribute, _as_bool),
+    ("placeholder", kAXPlaceholderValueAttribute, _as_str),
+)
+
+# Attributes read by serialize_element, fetched in a single accessibility call
+_SERIALIZE_ATTRS = tuple(attr for _, attr, _ in _SERIALIZE_SPEC)
+_SERIALIZE_FIELDS = tuple((key, coerce) for key, _, coerce in _SERIALIZE_SPEC)
+
+# PID -> (attributes to fetch, (key, coerce) per fetched attribute) learned by
+# learn_schema(); fields outside the schema serialize as None without a fetch
+_APP_SCHEMAS: dict[int, tuple[tuple[str, ...], tuple[tuple[str, Any], ...]]] = {}
+
+
+@dataclass
+class AXElementData:
+    """
+    Serialized element fields, as a slotted object instead of a dict.
+    
+    Cheaper to hold in bulk than the dicts serialize_element() returns
+    (no per-instance hash table); use to_dict() at the JSON boundary.
+    Field meanings match serialize_element().
+    """
+    
+    __slots__ = tuple(key for key, _, _ in _SERIALIZE_SPEC)
+    
+    role: Optional[str]
+    subrole: Optional[str]
+    title: Optional[str]
+    description: Optional[str]
+    value: Any
+    enabled: Optional[bool]
+    focused: Optional[bool]
+    position: Optional[dict[str, float]]
+    size: Optional[dict[str, float]]
+    identifier: Optional[str]
+    help: Optional[str]
+    selected: Optional[bool]
+    placeholder: Optional[str]
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields as a dict (same keys and order as serialize_element)."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+def _serialize_fields(element: AXUIElement,
+                      known: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    """Fetch and coerce the _SERIALIZE_SPEC fields of an element, in spec order."""
+    attrs, fields = _SERIALIZE_ATTRS, _SERIALIZE_FIELDS
+    result = {}
+    if _APP_SCHEMAS:
+        # Only fetch the attributes this app was seen to populate
+        err, pid = AXUIElementGetPid(element, None)
+        schema = _APP_SCHEMAS.get(pid) if err == 0 else None
+        if schema is not None:
+            attrs, fields = schema
+            result = dict.fromkeys(key for key, _ in _SERIALIZE_FIELDS)
+    
+    # Fetch every attribute in one round-trip, then coerce each per _SERIALIZE_SPEC
+    if known:
+        # Only fetch what the caller hasn't already read
+        missing = tuple(attr for attr in attrs if attr not in known)
+        fetched = dict(zip(missing, get_attributes(element, missing))) if missing else {}
+        values = [known[attr] if attr in known else fetched[attr] for attr in attrs]
+    else:
+        values = get_attributes(element, attrs)
+    result.update((key, coerce(value)) for (key, coerce), value in zip(fields, values))
+    return result
+
+
+def serialize_element(element: AXUIElement, *,
+                      include_attribute_names: bool = False,
+                      known: Optional[dict[str, Any]] = None) -> Optional[dict[str, Any]]:
     """
     Convert an AXUIElement to a dictionary with common attributes.
     
     Extracts the most commonly useful accessibility information
-    from an element and returns it as a dictionary.
+    from an element and returns it as a dictionary. The attributes
+    are read with a single get_attributes() call.
     
     Args:
         element: The AXUIElement to serialize.
+        include_attribute_names: Also list every attribute the element
+            supports. This costs a second accessibility round-trip per
+            element, so it is off by default.
+        known: Raw values already read for this element, keyed by AX
+            attribute name (e.g. from get_attributes()); only the
+            remaining attributes are fetched.
     
     Returns:
         A dictionary containing:
@@ -319,7 +899,8 @@ def serialize_element(element: AXUIElement) -> Optional[dict[str, Any]]:
             - position: Dict with 'x' and 'y' coordinates
             - size: Dict with 'width' and 'height'
             - identifier: Optional identifier string
-            - All available attributes in 'attributes' key
+            - _available_attributes: All attribute names (only with
+              include_attribute_names=True)
     
     Returns None on error.
     
@@ -329,159 +910,185 @@ def serialize_element(element: AXUIElement) -> Optional[dict[str, Any]]:
         ...     print(f"Element: {data['role']} - {data.get('title', 'No title')}")
     """
     if element is None:
-        logger.warning("Cannot serialize None element")
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Cannot serialize None element")
         return None
     
     try:
-        result = {}
-        
-        # Get role (most fundamental attribute)
-        role = get_attribute(element, kAXRoleAttribute)
-        result["role"] = str(role) if role else None
+        result = _serialize_fields(element, known)
         
-        # Get subrole for more detail
-        subrole = get_attribute(element, kAXSubroleAttribute)
-        result["subrole"] = str(subrole) if subrole else None
+        # All available attributes as raw list (extra round-trip, opt-in)
+        if include_attribute_names:
+            all_attrs = get_attribute_names(element)
+            result["_available_attributes"] = all_attrs if all_attrs else []
         
-        # Get title
-        title = get_attribute(element, kAXTitleAttribute)
-        result["title"] = str(title) if title else None
-        
-        # Get description
-        description = get_attribute(element, kAXDescriptionAttribute)
-        result["description"] = str(description) if description else None
-        
-        # Get value (varies by element type)
-        value = get_attribute(element, kAXValueAttribute)
-        if value is not None:
-            # Preserve native JSON types (bool, int, float, str, None)
-            if isinstance(value, (bool, int, float, str, type(None))):
-                result["value"] = value
-            elif hasattr(value, '__str__'):
-                result["value"] = str(value)
-            else:
-                result["value"] = value
-        else:
-            result["value"] = None
-        
-        # Get enabled state
-        enabled = get_attribute(element, kAXEnabledAttribute)
-        result["enabled"] = bool(enabled) if enabled is not None else None
-        
-        # Get focused state
-        focused = get_attribute(element, kAXFocusedAttribute)
-        result["focused"] = bool(focused) if focused is not None else None
-        
-        # Get position (AXPoint - CGPoint wrapped in AXValueRef)
-        position = get_attribute(element, kAXPositionAttribute)
-        if position is not None:
-            try:
-                # Try to unwrap AXValueRef wrapper using AXValueGetValue
-                # AXPosition is an AXValueRef that wraps a CGPoint
-                # Returns (success_bool, output_struct) - struct has .x/.y attributes
-                success, point = AXValueGetValue(position, kAXValueTypeCGPoint, None)
-                if success:
-                    result["position"] = {"x": point.x, "y": point.y}
-                # Fallback: try CGPoint attributes
-                elif hasattr(position, 'x') and hasattr(position, 'y'):
-                    result["position"] = {"x": position.x, "y": position.y}
-                elif isinstance(position, (tuple, list)) and len(position) >= 2:
-                    result["position"] = {"x": position[0], "y": position[1]}
-                else:
-                    result["position"] = position
-            except Exception as e:
-                logger.debug(f"Could not parse position: {e}")
-                result["position"] = str(position)
-        else:
-            result["position"] = None
-        
-        # Get size (AXSize - CGSize wrapped in AXValueRef)
-        size = get_attribute(element, kAXSizeAttribute)
-        if size is not None:
-            try:
-                # Try to unwrap AXValueRef wrapper using AXValueGetValue
-                # AXSize is an AXValueRef that wraps a CGSize
-                # Returns (success_bool, output_struct) - struct has .width/.height attributes
-                success, sz = AXValueGetValue(size, kAXValueTypeCGSize, None)
-                if success:
-                    result["size"] = {"width": sz.width, "height": sz.height}
-                # Fallback: try CGSize attributes
-                elif hasattr(size, 'width') and hasattr(size, 'height'):
-                    result["size"] = {"width": size.width, "height": size.height}
-                elif isinstance(size, (tuple, list)) and len(size) >= 2:
-                    result["size"] = {"width": size[0], "height": size[1]}
-                else:
-                    result["size"] = size
-            except Exception as e:
-                logger.debug(f"Could not parse size: {e}")
-                result["size"] = str(size)
-        else:
-            result["size"] = None
-        
-        # Get identifier
-        identifier = get_attribute(element, kAXIdentifierAttribute)
-        result["identifier"] = str(identifier) if identifier else None
-        
-        # Get help text
-        help_text = get_attribute(element, kAXHelpAttribute)
-        result["help"] = str(help_text) if help_text else None
-        
-        # Get selected state
-        selected = get_attribute(element, kAXSelectedAttribute)
-        result["selected"] = bool(selected) if selected is not None else None
-        
-        # Get placeholder (for text fields)
-        placeholder = get_attribute(element, kAXPlaceholderValueAttribute)
-        result["placeholder"] = str(placeholder) if placeholder else None
-        
-        # Get all available attributes as raw list
-        all_attrs = get_attribute_names(element)
-        result["_available_attributes"] = all_attrs if all_attrs else []
-        
-        logger.debug(f"Serialized element: {result.get('role')} - {result.get('title')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Serialized element: {result.get('role')} - {result.get('title')}")
         return result
-        
+    
+    except Exception as e:
+        logger.error(f"Error serializing element: {e}")
+        return None
+
+
+def serialize_element_data(element: AXUIElement) -> Optional[AXElementData]:
+    """
+    Serialize an element into an AXElementData instead of a dict.
+    
+    Same fields as serialize_element() (without _available_attributes),
+    for programmatic callers holding many serialized elements.
+    
+    Args:
+        element: The AXUIElement to serialize.
+    
+    Returns:
+        AXElementData, or None on error.
+    
+    Example:
+        >>> data = serialize_element_data(element)
+        >>> if data:
+        ...     print(f"Element: {data.role} - {data.title}")
+    """
+    if element is None:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Cannot serialize None element")
+        return None
+    
+    try:
+        return AXElementData(**_serialize_fields(element))
     except Exception as e:
         logger.error(f"Error serializing element: {e}")
         return None
 
 
-def _resolve_attribute_name(attr_name: str) -> str:
+def learn_schema(element: AXUIElement, samples: int = 20) -> frozenset[str]:
+    """
+    Learn which serialized attributes an app actually populates.
+    
+    Samples up to `samples` elements (the element and its descendants,
+    breadth-first) and records every attribute in _SERIALIZE_SPEC that
+    had a value. Later serialize_element() calls for elements of the same
+    app only fetch those attributes and report the rest as None, which
+    shrinks each batched request. Attributes the sample never saw will
+    always serialize as None, so sample a representative part of the UI.
+    
+    Args:
+        element: An element of the app (e.g. its app element or a window).
+        samples: Maximum number of elements to sample.
+    
+    Returns:
+        The attributes kept for the app (empty set on error).
+    
+    Example:
+        >>> learn_schema(get_app_by_name("Safari"))
+        >>> data = serialize_element(button)  # fetches only the learned attributes
+    """
+    if element is None:
+        return frozenset()
+    
+    try:
+        err, pid = AXUIElementGetPid(element, None)
+        if err != 0:
+            logger.error(f"Error getting PID for schema: error code {err}")
+            return frozenset()
+        
+        seen: set[str] = set()
+        queue = [element]
+        sampled = 0
+        while queue and sampled < samples:
+            current = queue.pop(0)
+            sampled += 1
+            values = get_attributes(current, _SERIALIZE_ATTRS)
+            seen.update(attr for attr, value in zip(_SERIALIZE_ATTRS, values) if value is not None)
+            if len(queue) < samples:
+                queue.extend(iter_children(current))
+        
+        spec = [(key, attr, coerce) for key, attr, coerce in _SERIALIZE_SPEC if attr in seen]
+        _APP_SCHEMAS[pid] = (
+            tuple(attr for _, attr, _ in spec),
+            tuple((key, coerce) for key, _, coerce in spec),
+        )
+        logger.debug("Learned schema for PID %s: %s", pid, sorted(seen))
+        return frozenset(seen)
+    
+    except Exception as e:
+        logger.error(f"Error learning schema: {e}")
+        return frozenset()
+
+
+def forget_schema(pid: Optional[int] = None) -> None:
+    """Drop the learned schema for one PID, or for every app if pid is None."""
+    if pid is None:
+        _APP_SCHEMAS.clear()
+    else:
+        _APP_SCHEMAS.pop(pid, None)
+
+
+def serialize_elements(elements: Iterable[AXUIElement], *,
+                       include_attribute_names: bool = False) -> list[Optional[dict[str, Any]]]:
+    """
+    Serialize many elements (e.g. a window's subtree) in one call.
+    
+    Args:
+        elements: The AXUIElements to serialize.
+        include_attribute_names: Passed through to serialize_element().
+    
+    Returns:
+        One serialize_element() result per input element, in order
+        (None where an element couldn't be serialized).
+    
+    Example:
+        >>> rows = serialize_elements(get_children(window))
+        >>> roles = [row["role"] for row in rows if row]
+    """
+    serialize = serialize_element
+    return [
+        serialize(element, include_attribute_names=include_attribute_names)
+        for element in elements
+    ]
+
+
+def _iter_elements(value: Any) -> Iterator[AXUIElement]:
+    """Iterate an element-array attribute value without copying it."""
+    if value is None:
+        return iter(())
+    
+    # Wrap a lone element (not an array)
+    if hasattr(value, '__iter__'):
+        return iter(value)
+    return iter((value,))
+
+
+def iter_windows(element: AXUIElement) -> Iterator[AXUIElement]:
     """
-    Resolve attribute name string to AX API constant.
+    Iterate the windows of an application element.
     
-    Handles conversion between string attribute names and
-    AX API constant names.
+    Walks the returned AXWindows array directly, for callers that only
+    loop over the windows once.
     
     Args:
-        attr_name: The attribute name as a string.
+        element: The AXUIElement for an application.
     
     Returns:
-        The resolved attribute name (constant or original string).
-    """
-    # Map of common attribute names
-    attr_map = {
-        "AXRole": kAXRoleAttribute,
-        "AXTitle": kAXTitleAttribute,
-        "AXDescription": kAXDescriptionAttribute,
-        "AXValue": kAXValueAttribute,
-        "AXEnabled": kAXEnabledAttribute,
-        "AXFocused": kAXFocusedAttribute,
-        "AXPosition": kAXPositionAttribute,
-        "AXSize": kAXSizeAttribute,
-        "AXWindows": kAXWindowsAttribute,
-        "AXChildren": kAXChildrenAttribute,
-        "AXParent": kAXParentAttribute,
-        "AXSubrole": kAXSubroleAttribute,
-        "AXIdentifier": kAXIdentifierAttribute,
-        "AXHelp": kAXHelpAttribute,
-        "AXSelected": kAXSelectedAttribute,
-        "AXSelectedText": kAXSelectedTextAttribute,
-        "AXVisible": kAXVisibleAttribute,
-    }
-    
-    # Return mapped value or original
-    return attr_map.get(attr_name, attr_name)
+        Iterator over window elements (empty if none found).
+    """
+    return _iter_elements(get_attribute(element, kAXWindowsAttribute))
+
+
+def iter_children(element: AXUIElement) -> Iterator[AXUIElement]:
+    """
+    Iterate the children of an element.
+    
+    Walks the returned AXChildren array directly, so tree walkers don't
+    build a list per level.
+    
+    Args:
+        element: The AXUIElement to get children from.
+    
+    Returns:
+        Iterator over child elements (empty if none found).
+    """
+    return _iter_elements(get_attribute(element, kAXChildrenAttribute))
 
 
 def get_windows(element: AXUIElement) -> Optional[list[AXUIElement]]:
@@ -497,14 +1104,7 @@ def get_windows(element: AXUIElement) -> Optional[list[AXUIElement]]:
     Returns:
         List of window elements, or empty list if none found.
     """
-    windows = get_attribute(element, kAXWindowsAttribute)
-    if windows is None:
-        return []
-    
-    # Convert to list if needed
-    if hasattr(windows, '__iter__'):
-        return list(windows)
-    return [windows]
+    return list(iter_windows(element))
 
 
 def get_children(element: AXUIElement) -> Optional[list[AXUIElement]]:
@@ -517,13 +1117,7 @@ def get_children(element: AXUIElement) -> Optional[list[AXUIElement]]:
     Returns:
         List of child elements, or empty list if none found.
     """
-    children = get_attribute(element, kAXChildrenAttribute)
-    if children is None:
-        return []
-    
-    if hasattr(children, '__iter__'):
-        return list(children)
-    return [children]
+    return list(iter_children(element))
 
 
 def list_running_apps() -> list[dict[str, Any]]:
@@ -534,22 +1128,11 @@ def list_running_apps() -> list[dict[str, Any]]:
         List of dicts with 'name', 'pid', 'bundle_id' keys.
     """
     try:
-        workspace = NSWorkspace.sharedWorkspace()
-        running_apps = workspace.runningApplications()
-        
-        result = []
-        for app in running_apps:
-            name = app.localizedName()
-            if not name:
-                continue
-            
-            result.append({
-                "name": str(name),
-                "pid": int(app.processIdentifier()),
-                "bundle_id": str(app.bundleIdentifier() or "")
-            })
-        
-        return result
+        # Apps without a name aren't indexed
+        return [
+            {"name": name, "pid": int(pid), "bundle_id": str(ns_app.bundleIdentifier() or "")}
+            for name, pid, ns_app in _RUNNING_APPS.snapshot()
+        ]
     except Exception as e:
         logger.error(f"Error listing apps: {e}")
         return []
@@ -568,6 +1151,128 @@ def get_parent(element: AXUIElement) -> Optional[AXUIElement]:
     return get_attribute(element, kAXParentAttribute)
 
 
+def watch_element(
+    element: AXUIElement,
+    notifications: Iterable[str],
+    callback: Callable[[AXUIElement, str], None],
+) -> Optional[Any]:
+    """
+    Get notified when an element changes instead of polling it.
+    
+    Registers an AXObserver for the given notifications and adds it to the
+    current thread's run loop. The callback runs while events are pumped,
+    either by a running run loop or by calling drain_events().
+    
+    Args:
+        element: The AXUIElement to watch.
+        notifications: AX notification names (e.g. kAXValueChangedNotification,
+            "AXTitleChanged", "AXFocusedUIElementChanged").
+        callback: Called as callback(element, notification) for each change.
+    
+    Returns:
+        The observer (pass to stop_watching()), or None on error.
+    
+    Example:
+        >>> def on_change(el, notification):
+        ...     print(notification, get_attribute(el, kAXValueAttribute))
+        >>> observer = watch_element(text_field, [kAXValueChangedNotification], on_change)
+        >>> while True:
+        ...     drain_events(1.0)
+    """
+    if element is None:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Cannot watch None element")
+        return None
+    
+    def _on_notification(observer, changed_element, notification, refcon):
+        if _defer_watch_callbacks:
+            _DEFERRED_WATCH_CALLBACKS.append((callback, changed_element, str(notification)))
+            return
+        try:
+            callback(changed_element, str(notification))
+        except Exception as e:
+            logger.error(f"Error in watch callback for {notification}: {e}")
+    
+    try:
+        err, pid = AXUIElementGetPid(element, None)
+        if err != 0:
+            logger.error(f"Error getting PID for watched element: error code {err}")
+            return None
+        
+        err, observer = AXObserverCreate(pid, _on_notification, None)
+        if err != 0 or observer is None:
+            logger.error(f"Error creating AXObserver for PID {pid}: error code {err}")
+            return None
+        
+        for notification in notifications:
+            err = AXObserverAddNotification(observer, element, notification, None)
+            if err != 0:
+                logger.warning(f"Could not watch {notification}: error code {err}")
+        
+        CFRunLoopAddSource(CFRunLoopGetCurrent(), AXObserverGetRunLoopSource(observer),
+                           kCFRunLoopDefaultMode)
+        _OBSERVERS.append(observer)
+        return observer
+    
+    except Exception as e:
+        logger.error(f"Error watching element: {e}")
+        return None
+
+
+def stop_watching(observer: Any) -> None:
+    """Remove an observer created by watch_element() from the run loop."""
+    if observer not in _OBSERVERS:
+        return
+    
+    CFRunLoopRemoveSource(CFRunLoopGetCurrent(), AXObserverGetRunLoopSource(observer),
+                          kCFRunLoopDefaultMode)
+    _OBSERVERS.remove(observer)
+
+
+def pump_events() -> None:
+    """Process pending Cocoa notifications (app launches/quits, watched elements)."""
+    drain_events(0.0)
+
+
+def _pump_app_notifications() -> None:
+    """
+    Deliver pending app launch/quit notifications for _RunningAppsIndex.
+    
+    The run loop also carries watch_element() observers, so their callbacks
+    are queued rather than run here: find() is called from arbitrary code
+    (including watch callbacks themselves) and mustn't reenter user code.
+    The queued callbacks run on the next drain_events().
+    """
+    global _defer_watch_callbacks
+    if _defer_watch_callbacks:
+        return
+    _defer_watch_callbacks = True
+    try:
+        CFRunLoopRunInMode(kCFRunLoopDefaultMode, 0.0, False)
+    finally:
+        _defer_watch_callbacks = False
+
+
+def drain_events(timeout: float = 0.0) -> None:
+    """
+    Deliver pending watch_element() notifications.
+    
+    Runs the current run loop for up to timeout seconds, so synchronous
+    CLI code can consume changes without running a full run loop.
+    
+    Args:
+        timeout: Seconds to pump events for (0 just delivers what's queued).
+    """
+    deferred = _DEFERRED_WATCH_CALLBACKS[:]
+    _DEFERRED_WATCH_CALLBACKS.clear()
+    for callback, element, notification in deferred:
+        try:
+            callback(element, notification)
+        except Exception as e:
+            logger.error(f"Error in watch callback for {notification}: {e}")
+    CFRunLoopRunInMode(kCFRunLoopDefaultMode, timeout, False)
+
+
 # ============================================================================
 # Module self-test (run when executed directly)
 # ============================================================================
@@ -7,8 +7,13 @@ within an application's accessibility tree. Built on top of ax_core.py.
 
 Functions:
     - query_elements(app_element, filters): Search tree for matching elements
+    - iter_elements(app_element, filters): Same, yielding matches as found
+    - query_elements_parallel(app_element, filters): Same, walking top-level
+      subtrees concurrently
     - parse_element_path(path): Navigate to element via path string
     - build_element_path(element): Build path string from element to root
+    - find_element_by_role / count_elements_by_role: Memoized role lookups
+      (invalidate_cache() drops them early)
 
 Requirements:
     - Python 3.9+
@@ -21,14 +26,22 @@ License: MIT
 
 from __future__ import annotations
 
+import copy
+import functools
+import itertools
 import logging
 import re
+import threading
 import time
-from typing import Any, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Callable, Iterator, Optional
 
 from ax_core import (
+    _AXKey,
     get_attribute,
+    get_attributes,
     get_children,
+    iter_children,
     get_attribute_names,
     serialize_element,
     kAXRoleAttribute,
@@ -36,8 +49,10 @@ from ax_core import (
     kAXDescriptionAttribute,
     kAXValueAttribute,
     kAXIdentifierAttribute,
+    kAXSubroleAttribute,
     kAXChildrenAttribute,
     kAXParentAttribute,
+    kAXHiddenAttribute,
 )
 
 # Configure logging
@@ -51,11 +66,44 @@ logger = logging.getLogger(__name__)
 AXUIElement = Any
 
 
+# Path segment pattern: role[index] - role is alphanumeric, index is integer
+_PATH_RE = re.compile(r'([a-zA-Z0-9_]+)\[(\d+)\]')
+
+# (root element, lookup, role, title) -> (expires_at, result) for the role
+# convenience lookups; the root is keyed by CF identity, as results depend on it
+_ROLE_CACHE: dict[tuple[Any, ...], tuple[float, Any]] = {}
+_ROLE_CACHE_MAX = 128
+_ROLE_CACHE_TTL = 1.0
+
+# Element (by CF identity) -> (expires_at, serialized dict) for search matches,
+# so back-to-back queries over an unchanged UI skip re-serializing; shared by
+# parallel search threads, hence the lock
+_SERIALIZED_CACHE: dict[_AXKey, tuple[float, dict[str, Any]]] = {}
+_SERIALIZED_CACHE_MAX = 2048
+_SERIALIZED_CACHE_TTL = 1.0
+_SERIALIZED_CACHE_LOCK = threading.Lock()
+
+# AX role -> its path spelling; roles are a small, mostly fixed vocabulary
+_ROLE_DISPLAY_CACHE: dict[Any, str] = {}
+
+# Filter keys -> AX attribute names
+_FILTER_ATTRS = {
+    "role": kAXRoleAttribute,
+    "title": kAXTitleAttribute,
+    "description": kAXDescriptionAttribute,
+    "value": kAXValueAttribute,
+    "identifier": kAXIdentifierAttribute,
+    "subrole": kAXSubroleAttribute,
+}
+
+
 def query_elements(
     app_element: AXUIElement,
     filters: dict[str, str],
     max_depth: int = 50,
     max_results: int = 100,
+    skip_hidden: bool = False,
+    fetch_executor: Optional[Executor] = None,
 ) -> list[dict[str, Any]]:
     """
     Search the accessibility tree for elements matching the given filters.
@@ -70,6 +118,11 @@ def query_elements(
                  Values are matched as case-insensitive substrings.
         max_depth: Maximum depth to traverse (default 50).
         max_results: Maximum number of results to return (default 100).
+        skip_hidden: Don't descend into elements whose AXHidden is true
+                     (background tabs, collapsed content).
+        fetch_executor: Executor to overlap the attribute fetches of each
+                        element's children on (each is a blocking IPC
+                        round-trip). Fetched one after another if not given.
     
     Returns:
         List of dictionaries, each containing:
@@ -97,32 +150,69 @@ def query_elements(
     
     # Empty filters = match all elements (useful for tree dumps)
     # If filters dict is empty, we'll still traverse but match everything
+    matches = iter_elements(app_element, filters, max_depth=max_depth,
+                            skip_hidden=skip_hidden, fetch_executor=fetch_executor)
+    results = list(itertools.islice(matches, max(max_results, 0)))
     
-    results: list[dict[str, Any]] = []
-    visited: set[int] = set()  # Track visited element IDs to avoid circular refs
+    logger.info(f"Found {len(results)} matching elements")
+    return results
+
+
+def iter_elements(
+    app_element: AXUIElement,
+    filters: dict[str, str],
+    max_depth: int = 50,
+    skip_hidden: bool = False,
+    fetch_executor: Optional[Executor] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield elements matching the given filters, in query_elements() order.
+    
+    The tree is walked lazily: nothing past the last match the caller
+    consumes is fetched, so stopping after the first hit is cheap.
+    
+    Args:
+        app_element: The AXUIElement for the application (root of search).
+        filters: Dictionary of attribute filters (see query_elements).
+        max_depth: Maximum depth to traverse (default 50).
+        skip_hidden: Don't descend into elements whose AXHidden is true.
+        fetch_executor: Executor to overlap sibling attribute fetches on
+                        (see query_elements).
+    
+    Yields:
+        Element dictionaries, as returned by query_elements().
+    
+    Example:
+        >>> app = get_app_by_name("Safari")
+        >>> field = next(iter_elements(app, {"role": "textfield"}), None)
+    """
+    if app_element is None:
+        logger.warning("Cannot query None app element")
+        return
+    
+    visited: set[_AXKey] = set()  # Track visited elements to avoid circular refs
     deadline = time.monotonic() + 30.0  # 30-second timeout
     
     # Normalize filters - convert "role=button" style to dict
     normalized_filters = _normalize_filters(filters)
     
-    # Start recursive search from app element
-    _search_recursive(
+    # Search the whole tree from the app element
+    yield from _iter_subtree(
         element=app_element,
         filters=normalized_filters,
         current_depth=0,
         max_depth=max_depth,
-        max_results=max_results,
-        results=results,
         path_prefix="",
         visited=visited,
         deadline=deadline,
+        fetch_attrs=_search_attrs(normalized_filters, skip_hidden),
+        needles=_compile_filters(normalized_filters),
+        skip_hidden=skip_hidden,
+        fetch_executor=fetch_executor,
     )
-    
-    logger.info(f"Found {len(results)} matching elements")
-    return results
 
 
-def _search_recursive(
+def _search_subtree(
     element: AXUIElement,
     filters: dict[str, str],
     current_depth: int,
@@ -130,96 +220,348 @@ def _search_recursive(
     max_results: int,
     results: list[dict[str, Any]],
     path_prefix: str,
-    visited: set[int] | None = None,
+    visited: set[_AXKey] | None = None,
     deadline: float = 0,
+    fetch_attrs: tuple[str, ...] | None = None,
+    attrs: dict[str, Any] | None = None,
+    stop: threading.Event | None = None,
+    skip_hidden: bool = False,
+    needles: tuple[tuple[str, str], ...] | None = None,
 ) -> None:
     """
-    Recursively search for matching elements.
+    Append up to max_results matches from a subtree to results.
+    
+    Takes the same arguments as _iter_subtree(), plus max_results and
+    the results list to fill.
+    """
+    if len(results) >= max_results:
+        return
+    
+    for serialized in _iter_subtree(
+        element, filters, current_depth, max_depth, path_prefix,
+        visited=visited, deadline=deadline, fetch_attrs=fetch_attrs, attrs=attrs,
+        stop=stop, skip_hidden=skip_hidden, needles=needles,
+    ):
+        results.append(serialized)
+        if len(results) >= max_results:
+            return
+
+
+def _iter_subtree(
+    element: AXUIElement,
+    filters: dict[str, str],
+    current_depth: int,
+    max_depth: int,
+    path_prefix: str,
+    visited: set[_AXKey] | None = None,
+    deadline: float = 0,
+    fetch_attrs: tuple[str, ...] | None = None,
+    attrs: dict[str, Any] | None = None,
+    stop: threading.Event | None = None,
+    skip_hidden: bool = False,
+    needles: tuple[tuple[str, str], ...] | None = None,
+    fetch_executor: Optional[Executor] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield matching elements of a subtree.
     
-    Internal function that performs depth-first traversal.
+    Internal generator that performs a depth-first traversal with an
+    explicit stack (no recursion, so deep trees can't hit the recursion
+    limit). Each element's role, children and filtered attributes are
+    read in one batched call. Paths are kept as parent-linked
+    (parent, role, index) nodes and only joined into strings for matches.
     
     Args:
-        element: Current element to check.
+        element: Root element of the subtree.
         filters: Normalized filter dictionary.
-        current_depth: Current traversal depth.
+        current_depth: Depth of the subtree root.
         max_depth: Maximum depth to traverse.
-        max_results: Maximum results to collect.
-        results: Results list to append to.
-        path_prefix: Current path string prefix.
-        visited: Set of visited element IDs (circular ref protection).
+        path_prefix: Path string of the subtree root.
+        visited: Set of visited element keys (circular ref protection).
         deadline: Monotonic timestamp to stop at (timeout protection).
+        fetch_attrs: Attributes to batch-fetch per element (from _search_attrs).
+        attrs: Already-fetched fetch_attrs values for the root, if any.
+        stop: Event that ends the search early once set (parallel searches).
+        skip_hidden: Prune children whose AXHidden is true (needs fetch_attrs
+                     from _search_attrs(filters, skip_hidden=True)).
+        needles: filters compiled by _compile_filters(), if already done.
+        fetch_executor: Executor to fetch each node's children concurrently on.
+                        Must not be the executor running this search, whose
+                        workers would then wait on each other.
     """
-    # Stop if timed out
-    if deadline and time.monotonic() > deadline:
-        logger.warning("Search timed out after 30 seconds")
-        return
+    if fetch_attrs is None:
+        fetch_attrs = _search_attrs(filters, skip_hidden)
+    if needles is None:
+        needles = _compile_filters(filters)
+    matches = _compile_matcher(needles)
+    
+    # (element, depth, path node, pre-fetched attrs); popped in document order.
+    # The subtree root's path node is None, standing for path_prefix.
+    stack = [(element, current_depth, None, attrs)]
+    
+    while stack:
+        # Stop if timed out
+        if deadline and time.monotonic() > deadline:
+            logger.warning("Search timed out after 30 seconds")
+            return
+        
+        # Stop if a parallel search has enough results
+        if stop is not None and stop.is_set():
+            return
+        
+        element, depth, path_node, attrs = stack.pop()
+        
+        # Skip anything past max depth
+        if depth > max_depth:
+            continue
+        
+        # Circular reference protection
+        if visited is not None:
+            elem_key = _AXKey(element)
+            if elem_key in visited:
+                continue
+            visited.add(elem_key)
+        
+        if attrs is None:
+            attrs = dict(zip(fetch_attrs, get_attributes(element, fetch_attrs)))
+        
+        # Check if current element matches filters
+        if matches(attrs):
+            # Serialize the element, reusing the attributes fetched for the
+            # search (path is materialized only for matches)
+            serialized = _serialize_match(element, attrs)
+            if serialized:
+                element_path = _join_path(path_node, path_prefix)
+                serialized["path"] = element_path
+                logger.debug(f"Matched element: {element_path}")
+                yield serialized
+        
+        # Children past max_depth would be rejected when popped
+        if depth >= max_depth:
+            continue
+        
+        # Build child paths
+        # Use per-role index counters (not raw enumeration index)
+        role_counters: dict[str, int] = {}
+        pending = []
+        children = attrs.get(kAXChildrenAttribute) or ()
+        
+        # One batched fetch per child; its role also names the path segment.
+        # Siblings' fetches are independent, so they can overlap on the executor
+        if fetch_executor is not None and len(children) > 1:
+            child_values = fetch_executor.map(get_attributes, children, itertools.repeat(fetch_attrs))
+        else:
+            child_values = (get_attributes(child, fetch_attrs) for child in children)
+        
+        for child, values in zip(children, child_values):
+            child_attrs = dict(zip(fetch_attrs, values))
+            
+            # Link the child's path node to ours: parentRole[parentIndex].childRole[childIndex]
+            child_role, role_idx = _path_index(child_attrs.get(kAXRoleAttribute), role_counters)
+            
+            # Hidden children still take their index, so sibling paths don't shift
+            if skip_hidden and child_attrs.get(kAXHiddenAttribute):
+                continue
+            pending.append((child, depth + 1, (path_node, child_role, role_idx), child_attrs))
+        
+        # Push in reverse so the first child is visited next
+        pending.reverse()
+        stack.extend(pending)
+
+
+def _serialize_match(element: AXUIElement, attrs: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """serialize_element() for a search match, reusing a result from the last second."""
+    key = _AXKey(element)
+    now = time.monotonic()
+    cached = _SERIALIZED_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        # Deep copy: position/size are nested dicts the caller may modify
+        return copy.deepcopy(cached[1])
+    
+    serialized = serialize_element(element, known=attrs)
+    if not serialized:
+        return serialized
+    
+    with _SERIALIZED_CACHE_LOCK:
+        # Evict the oldest entry when full
+        if key not in _SERIALIZED_CACHE and len(_SERIALIZED_CACHE) >= _SERIALIZED_CACHE_MAX:
+            del _SERIALIZED_CACHE[next(iter(_SERIALIZED_CACHE))]
+        _SERIALIZED_CACHE[key] = (now + _SERIALIZED_CACHE_TTL, copy.deepcopy(serialized))
+    return serialized
+
+
+def _search_attrs(filters: dict[str, str], skip_hidden: bool = False) -> tuple[str, ...]:
+    """Attributes to fetch per element: role, children, AXHidden if pruning, then filtered ones."""
+    fetch = [kAXRoleAttribute, kAXChildrenAttribute]
+    if skip_hidden:
+        fetch.append(kAXHiddenAttribute)
+    for filter_key in filters:
+        ax_attr = _FILTER_ATTRS.get(filter_key, filter_key)
+        if ax_attr not in fetch:
+            fetch.append(ax_attr)
+    return tuple(fetch)
+
+
+def _display_role(role: Any) -> str:
+    """Path spelling of an AX role ("AXWindow" -> "window"), memoized per role."""
+    display = _ROLE_DISPLAY_CACHE.get(role)
+    if display is None:
+        display = str(role).lower() if role else "element"
+        
+        # Strip "AX" prefix to match spec examples: window[0] not axwindow[0]
+        display = display.replace('ax', '', 1)
+        _ROLE_DISPLAY_CACHE[role] = display
+    return display
+
+
+def _path_index(child_role: Any, role_counters: dict[str, int]) -> tuple[str, int]:
+    """Return the (role, index) of a path segment from an already-fetched role."""
+    child_role_str = _display_role(child_role)
     
-    # Stop if we've reached max results
-    if len(results) >= max_results:
-        return
+    # Use per-role index counter
+    role_idx = role_counters.get(child_role_str, 0)
+    role_counters[child_role_str] = role_idx + 1
     
-    # Stop if we've reached max depth
-    if current_depth > max_depth:
-        return
+    return child_role_str, role_idx
+
+
+def _path_segment(child_role: Any, role_counters: dict[str, int]) -> str:
+    """Build the "role[index]" path segment from an already-fetched role."""
+    return "%s[%d]" % _path_index(child_role, role_counters)
+
+
+def _join_path(path_node: tuple | None, path_prefix: str) -> str:
+    """Materialize a (parent, role, index) path node chain below path_prefix."""
+    parts = []
+    while path_node is not None:
+        path_node, role, index = path_node
+        parts.append(f"{role}[{index}]")
+    if path_prefix:
+        parts.append(path_prefix)
+    parts.reverse()
+    return ".".join(parts)
+
+
+def query_elements_parallel(
+    app_element: AXUIElement,
+    filters: dict[str, str],
+    max_depth: int = 50,
+    max_results: int = 100,
+    executor: Optional[Executor] = None,
+    skip_hidden: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Search the accessibility tree, exploring top-level subtrees concurrently.
     
-    # Circular reference protection
-    elem_id = id(element)
-    if visited is not None:
-        if elem_id in visited:
-            return
-        visited.add(elem_id)
+    Each AX call is a blocking IPC round-trip to the target app that releases
+    the GIL, so walking sibling subtrees on a thread pool overlaps that latency.
+    Results are returned in the same order as query_elements(), and running
+    subtrees are told to stop once the ones before them already hold
+    max_results matches.
     
-    # Check if current element matches filters
-    if _element_matches_filters(element, filters):
-        # Use path_prefix directly (path is built during traversal)
-        element_path = path_prefix
-        
-        # Serialize the element
-        serialized = serialize_element(element)
+    Args:
+        app_element: The AXUIElement for the application (root of search).
+        filters: Dictionary of attribute filters (see query_elements).
+        max_depth: Maximum depth to traverse (default 50).
+        max_results: Maximum number of results to return (default 100).
+        executor: Executor to run subtree searches on. A temporary
+                  8-worker ThreadPoolExecutor is used if not given.
+        skip_hidden: Don't descend into elements whose AXHidden is true.
+    
+    Returns:
+        List of element dictionaries, as returned by query_elements().
+    """
+    if app_element is None:
+        logger.warning("Cannot query None app element")
+        return []
+    
+    deadline = time.monotonic() + 30.0  # 30-second timeout
+    normalized_filters = _normalize_filters(filters)
+    
+    # The root itself is checked inline, as in _search_subtree
+    results: list[dict[str, Any]] = []
+    fetch_attrs = _search_attrs(normalized_filters, skip_hidden)
+    needles = _compile_filters(normalized_filters)
+    root_attrs = dict(zip(fetch_attrs, get_attributes(app_element, fetch_attrs)))
+    if _element_matches_filters_cached(root_attrs, needles):
+        serialized = serialize_element(app_element, known=root_attrs)
         if serialized:
-            serialized["path"] = element_path
+            serialized["path"] = ""
             results.append(serialized)
-            
-            logger.debug(f"Matched element: {element_path}")
     
-    # Get children and continue search
-    children = get_children(element)
-    if not children:
-        return
-    
-    # Build child path prefix
-    # Use per-role index counters (not raw enumeration index)
-    role_counters: dict[str, int] = {}
+    if max_depth < 1 or len(results) >= max_results:
+        return results
     
-    for child in children:
-        # Get each child's role BEFORE building its path
-        child_role = get_attribute(child, kAXRoleAttribute)
-        child_role_str = str(child_role).lower() if child_role else "element"
-        
-        # Strip "AX" prefix to match spec examples: window[0] not axwindow[0]
-        child_role_str = child_role_str.replace('ax', '', 1)
-        
-        # Use per-role index counter
-        role_idx = role_counters.get(child_role_str, 0)
-        role_counters[child_role_str] = role_idx + 1
-        
-        # Construct path for child: parentRole[parentIndex].childRole[childIndex]
-        if current_depth == 0:
-            child_path = f"{child_role_str}[{role_idx}]"
-        else:
-            child_path = f"{path_prefix}.{child_role_str}[{role_idx}]"
+    children = list(root_attrs.get(kAXChildrenAttribute) or ())
+    if not children:
+        return results
+    
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=min(8, len(children)))
+    
+    try:
+        # One task (with its own result list) per top-level child
+        subtree_results: list[list[dict[str, Any]]] = []
+        futures = {}
+        role_counters: dict[str, int] = {}
+        remaining = max_results - len(results)
+        stop = threading.Event()
+        for child in children:
+            # Batched here so the task starts from these attrs, as nested children do
+            child_attrs = dict(zip(fetch_attrs, get_attributes(child, fetch_attrs)))
+            segment = _path_segment(child_attrs.get(kAXRoleAttribute), role_counters)
+            if skip_hidden and child_attrs.get(kAXHiddenAttribute):
+                continue
+            
+            child_results: list[dict[str, Any]] = []
+            index = len(subtree_results)
+            subtree_results.append(child_results)
+            future = executor.submit(
+                _search_subtree,
+                element=child,
+                filters=normalized_filters,
+                current_depth=1,
+                max_depth=max_depth,
+                max_results=remaining,
+                results=child_results,
+                path_prefix=segment,
+                visited=set(),
+                deadline=deadline,
+                fetch_attrs=fetch_attrs,
+                attrs=child_attrs,
+                needles=needles,
+                stop=stop,
+                skip_hidden=skip_hidden,
+            )
+            futures[future] = index
         
-        _search_recursive(
-            element=child,
-            filters=filters,
-            current_depth=current_depth + 1,
-            max_depth=max_depth,
-            max_results=max_results,
-            results=results,
-            path_prefix=child_path,
-            visited=visited,
-            deadline=deadline,
-        )
+        # Once the finished leading subtrees (in document order) hold enough
+        # matches, nothing after them can make the cut: cancel and stop the rest
+        done = [False] * len(subtree_results)
+        leading = found = 0
+        for future in as_completed(futures):
+            future.result()
+            done[futures[future]] = True
+            while leading < len(done) and done[leading]:
+                found += len(subtree_results[leading])
+                leading += 1
+            if found >= remaining:
+                stop.set()
+                for pending in futures:
+                    pending.cancel()
+                break
+        wait(futures)
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True)
+    
+    for child_results in subtree_results:
+        results.extend(child_results)
+    
+    del results[max_results:]
+    logger.info(f"Found {len(results)} matching elements")
+    return results
 
 
 def _element_matches_filters(element: AXUIElement, filters: dict[str, str]) -> bool:
@@ -236,20 +578,7 @@ def _element_matches_filters(element: AXUIElement, filters: dict[str, str]) -> b
     if not filters:
         return True
     
-    # Map filter keys to AX attribute names
-    attr_map = {
-        "role": kAXRoleAttribute,
-        "title": kAXTitleAttribute,
-        "description": kAXDescriptionAttribute,
-        "value": kAXValueAttribute,
-        "identifier": kAXIdentifierAttribute,
-        "subrole": "AXSubrole",
-    }
-    
-    for filter_key, filter_value in filters.items():
-        # Get the corresponding AX attribute
-        ax_attr = attr_map.get(filter_key, filter_key)
-        
+    for ax_attr, needle in _compile_filters(filters):
         # Get the element's attribute value
         attr_value = get_attribute(element, ax_attr)
         
@@ -257,16 +586,78 @@ def _element_matches_filters(element: AXUIElement, filters: dict[str, str]) -> b
         if attr_value is None:
             return False
         
-        attr_str = str(attr_value).lower()
-        filter_str = filter_value.lower()
-        
         # Check if filter value is in the attribute (substring match)
-        if filter_str not in attr_str:
+        if needle not in str(attr_value).lower():
+            return False
+    
+    return True
+
+
+def _compile_filters(filters: dict[str, str]) -> tuple[tuple[str, str], ...]:
+    """Resolve filters once to (AX attribute, lower-cased needle) pairs, in order."""
+    return tuple(
+        (_FILTER_ATTRS.get(filter_key, filter_key), filter_value.lower())
+        for filter_key, filter_value in filters.items()
+    )
+
+
+def _element_matches_filters_cached(attrs: dict[str, Any],
+                                    needles: tuple[tuple[str, str], ...]) -> bool:
+    """
+    Check pre-fetched attribute values against all the given filters.
+    
+    Same matching as _element_matches_filters(), but on a dict from a
+    batched fetch (see _search_attrs), so no AX calls are made.
+    
+    Args:
+        attrs: AX attribute name -> value for the element.
+        needles: Compiled filters from _compile_filters().
+    
+    Returns:
+        True if element matches all filters, False otherwise.
+    """
+    for ax_attr, needle in needles:
+        attr_value = attrs.get(ax_attr)
+        if attr_value is None:
+            return False
+        
+        # Check if filter value is in the attribute (case-insensitive substring match);
+        # AX strings arrive as str subclasses, so skip the str() copy for those
+        if not isinstance(attr_value, str):
+            attr_value = str(attr_value)
+        if needle not in attr_value.lower():
             return False
     
     return True
 
 
+def _compile_matcher(needles: tuple[tuple[str, str], ...]) -> Callable[[dict[str, Any]], bool]:
+    """
+    Specialize _element_matches_filters_cached() to one set of compiled filters.
+    
+    No filters (tree dumps) and a single filter (the usual role query) get
+    straight-line closures without the per-element loop; anything else
+    uses the general matcher.
+    """
+    if not needles:
+        return lambda attrs: True
+    
+    if len(needles) == 1:
+        ((ax_attr, needle),) = needles
+        
+        def match_one(attrs: dict[str, Any]) -> bool:
+            attr_value = attrs.get(ax_attr)
+            if attr_value is None:
+                return False
+            if not isinstance(attr_value, str):
+                attr_value = str(attr_value)
+            return needle in attr_value.lower()
+        
+        return match_one
+    
+    return functools.partial(_element_matches_filters_cached, needles=needles)
+
+
 def _normalize_filters(filters: dict[str, str] | list[str]) -> dict[str, str]:
     """
     Normalize filters from various input formats.
@@ -275,7 +666,8 @@ def _normalize_filters(filters: dict[str, str] | list[str]) -> dict[str, str]:
         filters: Either a dict or list of "key=value" strings.
     
     Returns:
-        Normalized dictionary of key->value filters.
+        Normalized dictionary of key->value filters, with "role" first.
+        An already-normalized dict is returned as-is, so treat it as read-only.
     
     Example:
         >>> _normalize_filters({"role": "button"})
@@ -284,17 +676,25 @@ def _normalize_filters(filters: dict[str, str] | list[str]) -> dict[str, str]:
         {'role': 'button', 'title': 'Submit'}
     """
     if isinstance(filters, dict):
-        return {k: str(v) for k, v in filters.items()}
-    
-    # Handle list format ["role=button", "title=Submit"]
-    normalized = {}
-    for item in filters:
-        if isinstance(item, str) and "=" in item:
-            key, value = item.split("=", 1)
-            normalized[key.strip()] = value.strip()
-        elif isinstance(item, dict):
-            normalized.update({k: str(v) for k, v in item.items()})
-    
+        if all(type(v) is str for v in filters.values()):
+            # Common case: plain str values, so only the role may need moving
+            if "role" not in filters or next(iter(filters)) == "role":
+                return filters
+            return {"role": filters["role"], **filters}
+        normalized = {k: str(v) for k, v in filters.items()}
+    else:
+        # Handle list format ["role=button", "title=Submit"]
+        normalized = {}
+        for item in filters:
+            if isinstance(item, str) and "=" in item:
+                key, value = item.split("=", 1)
+                normalized[key.strip()] = value.strip()
+            elif isinstance(item, dict):
+                normalized.update({k: str(v) for k, v in item.items()})
+    
+    # Check role first: it rejects most elements
+    if "role" in normalized:
+        normalized = {"role": normalized.pop("role"), **normalized}
     return normalized
 
 
@@ -333,10 +733,10 @@ def parse_element_path(
         logger.warning("Empty path provided")
         return None
     
-    # Parse the path into segments
-    segments = _parse_path_string(path)
+    # Parse the path into (role, index) tokens (cached per path string)
+    tokens = _parse_path_tokens(path)
     
-    if not segments:
+    if not tokens:
         logger.error(f"Invalid path format: {path}")
         return None
     
@@ -344,22 +744,12 @@ def parse_element_path(
     current_element = app_element
     current_path = ""
     
-    for idx, segment in enumerate(segments):
-        role_pattern = segment["role"]
-        target_index = segment["index"]
-        
-        # Get children of current element
-        children = get_children(current_element)
-        
-        if not children:
-            logger.debug(f"No children at path: {current_path}")
-            return None
-        
-        # Find matching child by role and index
+    for role_pattern, target_index in tokens:
+        # Find matching child of current element by role and index
         found_element = None
         matching_count = 0
         
-        for child_idx, child in enumerate(children):
+        for child in iter_children(current_element):
             child_role = get_attribute(child, kAXRoleAttribute)
             if child_role:
                 child_role_str = str(child_role).lower()
@@ -396,16 +786,23 @@ def _parse_path_string(path: str) -> list[dict[str, str | int]]:
         >>> _parse_path_string("window[0].toolbar[0].button[3]")
         [{'role': 'window', 'index': 0}, {'role': 'toolbar', 'index': 0}, {'role': 'button', 'index': 3}]
     """
-    # Pattern: role[index] - role is alphanumeric, index is integer
-    pattern = re.compile(r'([a-zA-Z0-9_]+)\[(\d+)\]')
+    return [{"role": role, "index": index} for role, index in _parse_path_tokens(path)]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_path_tokens(path: str) -> tuple[tuple[str, int], ...]:
+    """
+    Parse a path string into (role, index) tokens.
+    
+    Cached, since scripted callers resolve the same paths repeatedly.
     
-    segments = []
-    for match in pattern.finditer(path):
-        role = match.group(1)
-        index = int(match.group(2))
-        segments.append({"role": role, "index": index})
+    Args:
+        path: Path string like "window[0].toolbar[0].button[3]"
     
-    return segments
+    Returns:
+        Tuple of (role, index) pairs.
+    """
+    return tuple([(role, int(index)) for role, index in _PATH_RE.findall(path)])
 
 
 def find_element_by_role(
@@ -416,6 +813,8 @@ def find_element_by_role(
     """
     Convenience function to find a single element by role and optional title.
     
+    The result is reused for up to a second per root element (see invalidate_cache).
+    
     Args:
         app_element: The AXUIElement for the application.
         role: The AX role to search for (e.g., "AXButton", "AXTextField").
@@ -434,9 +833,12 @@ def find_element_by_role(
     if title:
         filters["title"] = title
     
-    results = query_elements(app_element, filters, max_results=1)
-    
-    return results[0] if results else None
+    result = _cached_role_lookup(
+        app_element,
+        ("find", role, title),
+        lambda: next(iter_elements(app_element, filters), None),
+    )
+    return copy.deepcopy(result) if result else None
 
 
 def count_elements_by_role(
@@ -446,6 +848,8 @@ def count_elements_by_role(
     """
     Count elements of a specific role in the application.
     
+    The count is reused for up to a second per root element (see invalidate_cache).
+    
     Args:
         app_element: The AXUIElement for the application.
         role: The AX role to count (e.g., "AXButton").
@@ -458,8 +862,46 @@ def count_elements_by_role(
         >>> button_count = count_elements_by_role(app, "AXButton")
         >>> print(f"Safari has {button_count} buttons")
     """
-    results = query_elements(app_element, {"role": role}, max_results=1000)
-    return len(results)
+    return _cached_role_lookup(
+        app_element,
+        ("count", role, None),
+        lambda: len(query_elements(app_element, {"role": role}, max_results=1000)),
+    )
+
+
+def _cached_role_lookup(app_element: AXUIElement, key: tuple[Any, ...], lookup) -> Any:
+    """
+    Return lookup(), reusing its result for _ROLE_CACHE_TTL seconds per root.
+    
+    Scripted callers often repeat the same role lookup in a burst while the
+    UI is unchanged; each uncached call walks the whole subtree.
+    """
+    if app_element is None:
+        return lookup()
+    
+    now = time.monotonic()
+    cache_key = (_AXKey(app_element), *key)
+    cached = _ROLE_CACHE.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    result = lookup()
+    if len(_ROLE_CACHE) >= _ROLE_CACHE_MAX:
+        _ROLE_CACHE.clear()
+    _ROLE_CACHE[cache_key] = (now + _ROLE_CACHE_TTL, result)
+    return result
+
+
+def invalidate_cache() -> None:
+    """
+    Drop memoized role lookups and serialized search matches.
+    
+    Call after acting on the UI (or from a watch_element() callback) when
+    the next lookup must not see the tree as it was up to a second ago.
+    """
+    _ROLE_CACHE.clear()
+    with _SERIALIZED_CACHE_LOCK:
+        _SERIALIZED_CACHE.clear()
 
 
 # ============================================================================
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the ax-helper.py JSON output helpers.
+
+These don't touch the Accessibility APIs, so they run without PyObjC:
+
+    python3 -m unittest test_ax_helper
+"""
+
+import importlib.util
+import io
+import json
+import os
+import unittest
+from unittest import mock
+
+_SPEC = importlib.util.spec_from_file_location(
+    "ax_helper", os.path.join(os.path.dirname(os.path.abspath(__file__)), "ax-helper.py")
+)
+ax_helper = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(ax_helper)
+
+
+class _Double(float):
+    """Stand-in for the float subclass PyObjC returns for NSNumber doubles."""
+
+
+class DumpsTest(unittest.TestCase):
+    def test_float_subclass(self):
+        self.assertEqual(json.loads(ax_helper._dumps({"value": _Double(0.5)})), {"value": 0.5})
+    
+    def test_float_subclass_without_orjson(self):
+        with mock.patch.object(ax_helper, "orjson", None):
+            self.assertEqual(json.loads(ax_helper._dumps([_Double(2.0)])), [2.0])
+
+
+class WriteJsonTest(unittest.TestCase):
+    def _write(self, data):
+        stdout = io.TextIOWrapper(io.BytesIO())
+        with mock.patch.object(ax_helper.sys, "stdout", stdout):
+            ax_helper.write_json(data)
+        return stdout.buffer.getvalue()
+    
+    def test_matches_json_dumps(self):
+        data = {"app": "Finder", "tree": [{"role": "AXButton", "size": {"width": 1}}], "empty": [], "count": 1}
+        self.assertEqual(self._write(data), (json.dumps(data, indent=2) + "\n").encode())
+    
+    def test_encoding_error_writes_nothing(self):
+        stdout = io.TextIOWrapper(io.BytesIO())
+        with mock.patch.object(ax_helper.sys, "stdout", stdout):
+            with self.assertRaises(TypeError):
+                ax_helper.write_json({"tree": [{"role": "AXButton"}, object()]})
+        self.assertEqual(stdout.buffer.getvalue(), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()